@@ -0,0 +1,127 @@
+"""Measures framework overhead by running the page-object flows against the bundled fixture site
+
+    python benchmarks/run_benchmarks.py --runs 10 --save-baseline
+    python benchmarks/run_benchmarks.py --runs 10 --threshold 0.2
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from helpers import benchmark
+from helpers.browser_profiles import PROFILES, DEFAULT
+from helpers.driver_manager import DriverPool
+from helpers.instrumentation import StepRecorder
+from helpers.wait_engine import WaitEngine
+from pages.home_page import HomePage
+from pages.careers_page import CareersPage
+from pages.qa_careers_page import QACareersPage
+
+logger = logging.getLogger("benchmarks")
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results", "baseline.json")
+
+
+def run_workflow(driver, server):
+    """The Insider careers workflow from tests/test_insider_careers.py, pointed at the fixture site"""
+    home_page = HomePage(driver)
+    home_page.open_page(server.url("/"))
+    home_page.accept_cookies()
+    home_page.navigate_to_careers()
+
+    CareersPage(driver).verify_sections()
+
+    qa_careers_page = QACareersPage(driver)
+    qa_careers_page.navigate_to_qa_careers()
+    qa_careers_page.filter_jobs("Istanbul, Turkiye", "Quality Assurance")
+    qa_careers_page.verify_job_listings("Quality Assurance", "Istanbul, Turkiye")
+    qa_careers_page.validate_view_role_links()
+    qa_careers_page.verify_view_role_buttons(sample_index=0)
+
+
+def measure(pool, server, runs, warmup):
+    """Runs the workflow repeatedly on a warm pooled driver and returns one measurement per measured run"""
+    measurements = []
+    for index in range(warmup + runs):
+        driver = pool.acquire()
+        WaitEngine.reset()
+        recorder = StepRecorder(f"benchmark_{index}")
+        recorder.attach(driver)
+        start = time.perf_counter()
+        try:
+            run_workflow(driver, server)
+        finally:
+            wall = time.perf_counter() - start
+            recorder.detach()
+            pool.release(driver)
+        if index < warmup:
+            continue
+        measurements.append({
+            "wall": wall,
+            "commands": recorder.commands,
+            "steps": {
+                name: {"duration": duration, "commands": commands}
+                for name, duration, commands, _, _ in recorder.summary_rows()
+            },
+        })
+        logger.info("Run %s/%s: %.2fs, %s WebDriver commands", index - warmup + 1, runs, wall, recorder.commands)
+    return measurements
+
+
+def print_summary(summary):
+    print(f"{'Step':<45} {'p50 (s)':>9} {'p90 (s)':>9} {'p95 (s)':>9} {'commands':>9}")
+    rows = [("(total)", summary["wall"], summary["commands"])] + [
+        (name, entry["duration"], entry["commands"]) for name, entry in summary["steps"].items()
+    ]
+    for name, duration, commands in rows:
+        print(f"{name:<45} {duration['p50']:>9.3f} {duration['p90']:>9.3f} {duration['p95']:>9.3f} {commands['p50']:>9.0f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--browser", default="chrome", choices=("chrome", "firefox"))
+    parser.add_argument("--profile", default=DEFAULT, choices=PROFILES)
+    parser.add_argument("--runs", type=int, default=5, help="Measured runs")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured runs before measuring, e.g. to warm caches")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline summary to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run's summary as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed p50 growth per step, as a fraction")
+    parser.add_argument("--min-seconds", type=float, default=0.05, help="Ignore time regressions smaller than this")
+    parser.add_argument("--output", help="Also write this run's summary as JSON to this path")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+    logger.setLevel(logging.INFO)
+
+    server = benchmark.FixtureServer().start()
+    pool = DriverPool(args.browser, profile=args.profile, max_uses=args.runs + args.warmup)
+    try:
+        summary = benchmark.summarize_runs(measure(pool, server, args.runs, args.warmup))
+    finally:
+        pool.close_all()
+        server.stop()
+    summary["environment"] = {"browser": args.browser, "profile": args.profile}
+
+    print_summary(summary)
+    if args.output:
+        benchmark.save_baseline(args.output, summary)
+    if args.save_baseline:
+        logger.info("Baseline saved to %s", benchmark.save_baseline(args.baseline, summary))
+        return 0
+
+    baseline = benchmark.load_baseline(args.baseline)
+    if baseline is None:
+        logger.info("No baseline at %s; run with --save-baseline to create one", args.baseline)
+        return 0
+    regressions = benchmark.find_regressions(summary, baseline, args.threshold, args.min_seconds)
+    for regression in regressions:
+        print(f"REGRESSION {json.dumps(regression)}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
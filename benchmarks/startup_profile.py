@@ -0,0 +1,45 @@
+"""Checks that test discovery stays within its startup budget and imports no browser stack
+
+    python benchmarks/startup_profile.py --budget-ms 1500
+    python benchmarks/startup_profile.py -- tests/test_timing_db.py -k pack
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from helpers.startup_profile import profile_collection, slowest_imports
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=1500, help="Allowed wall time for pytest --collect-only")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs to take the fastest of, to skip cold-cache noise")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest imports to print")
+    parser.add_argument("pytest_args", nargs="*", default=["tests"], help="Arguments passed to pytest")
+    args = parser.parse_args(argv)
+
+    profiles = [profile_collection(args.pytest_args) for _ in range(args.repeat)]
+    profile = min(profiles, key=lambda result: result["wall_ms"])
+    if profile["returncode"] != 0:
+        print(f"pytest --collect-only exited with {profile['returncode']}")
+        return profile["returncode"]
+
+    print(f"{'Import':<50} {'cumulative (ms)':>16}")
+    for name, milliseconds in slowest_imports(profile["imports"], args.top):
+        print(f"{name:<50} {milliseconds:>16.1f}")
+    print(f"Collection wall time: {profile['wall_ms']:.0f}ms (budget {args.budget_ms:.0f}ms)")
+
+    failed = False
+    if profile["heavy"]:
+        print(f"Collection imported browser-only modules: {', '.join(profile['heavy'])}")
+        failed = True
+    if profile["wall_ms"] > args.budget_ms:
+        print("Startup budget exceeded")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+import functools
+import hashlib
+import io
+import logging
+import os
+import queue
+import threading
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+POLICIES = ("on-failure", "always", "none")
+FORMATS = ("jpeg", "webp", "png")
+
+
+@functools.lru_cache(maxsize=None)
+def _pillow():
+    """Imports Pillow on first use; it is optional, and screenshots are then stored as captured PNGs"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    return Image
+
+
+class ArtifactWriter:
+    """Encodes, deduplicates and writes screenshots on a background thread"""
+
+    def __init__(self, output_dir, image_format="jpeg", quality=70, max_width=1280):
+        self.output_dir = output_dir
+        self.image_format = image_format if _pillow() else "png"
+        self.quality = quality
+        self.max_width = max_width
+        self.stats = {"submitted": 0, "duplicates": 0, "written": 0, "raw_bytes": 0, "written_bytes": 0}
+        self._paths_by_digest = {}
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+        self._thread.start()
+
+        if image_format != "png" and not _pillow():
+            logger.warning("Pillow is not installed; screenshots will be written as uncompressed PNG")
+
+    def capture(self, driver, name):
+        """Grabs screenshot bytes on the calling thread and queues them for writing; returns the target path"""
+        return self.submit(driver.get_screenshot_as_png(), name)
+
+    def submit(self, png_bytes, name):
+        """Queues PNG bytes for encoding and returns the path they will be written to
+
+        Identical screenshots are written once; later submissions return the existing path.
+        """
+        self.stats["submitted"] += 1
+        self.stats["raw_bytes"] += len(png_bytes)
+        digest = hashlib.sha1(png_bytes).hexdigest()
+        if digest in self._paths_by_digest:
+            self.stats["duplicates"] += 1
+            return self._paths_by_digest[digest]
+
+        extension = "jpg" if self.image_format == "jpeg" else self.image_format
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.output_dir, f"{name}_{timestamp}_{digest[:8]}.{extension}")
+        self._paths_by_digest[digest] = path
+        self._queue.put((png_bytes, path))
+        return path
+
+    def close(self):
+        """Waits for queued artifacts to be written and stops the worker"""
+        self._queue.put(None)
+        self._thread.join()
+        logger.info("Artifact writer finished: %s", self.stats)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            png_bytes, path = item
+            try:
+                data = self._encode(png_bytes)
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                with open(path, "wb") as f:
+                    f.write(data)
+                self.stats["written"] += 1
+                self.stats["written_bytes"] += len(data)
+                logger.info("Screenshot saved to: %s", path)
+            except Exception as e:
+                logger.error("Failed to write screenshot %s: %s", path, e)
+
+    def _encode(self, png_bytes):
+        Image = _pillow()
+        if not Image:
+            return png_bytes
+
+        image = Image.open(io.BytesIO(png_bytes))
+        if image.width > self.max_width:
+            image = image.resize((self.max_width, round(image.height * self.max_width / image.width)))
+
+        output = io.BytesIO()
+        if self.image_format == "jpeg":
+            image.convert("RGB").save(output, "JPEG", quality=self.quality, optimize=True)
+        elif self.image_format == "webp":
+            image.save(output, "WEBP", quality=self.quality)
+        else:
+            image.save(output, "PNG", optimize=True)
+        return output.getvalue()
@@ -0,0 +1,106 @@
+import functools
+import json
+import logging
+import os
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+FIXTURE_SITE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "site")
+PERCENTILES = (50, 90, 95)
+
+
+class FixtureServer:
+    """Serves the bundled static fixture site from a background thread on a free local port"""
+
+    def __init__(self, root=FIXTURE_SITE_DIR, host="127.0.0.1", port=0):
+        handler = functools.partial(_QuietHandler, directory=root)
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._thread = None
+
+    @property
+    def origin(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path="/"):
+        return f"{self.origin}{path}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info("Fixture site served at %s", self.origin)
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        logger.debug("Fixture server: " + format, *args)
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of a non-empty sequence"""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def _distribution(values):
+    return {f"p{pct}": round(percentile(values, pct), 4) for pct in PERCENTILES} | {"max": round(max(values), 4)}
+
+
+def summarize_runs(runs):
+    """Aggregates runs of {"wall": s, "commands": n, "steps": {name: {"duration": s, "commands": n}}}"""
+    step_names = list(dict.fromkeys(name for run in runs for name in run["steps"]))
+    return {
+        "runs": len(runs),
+        "wall": _distribution([run["wall"] for run in runs]),
+        "commands": _distribution([run["commands"] for run in runs]),
+        "steps": {
+            name: {
+                "duration": _distribution([run["steps"][name]["duration"] for run in runs if name in run["steps"]]),
+                "commands": _distribution([run["steps"][name]["commands"] for run in runs if name in run["steps"]]),
+            }
+            for name in step_names
+        },
+    }
+
+
+def find_regressions(summary, baseline, threshold=0.2, min_seconds=0.05, metric="p50"):
+    """Lists steps, and the whole flow, whose time or command count grew by more than `threshold` over the baseline
+
+    Time regressions smaller than `min_seconds` are ignored so that noise on very short steps does not fail a run.
+    """
+    current = {"(total)": {"duration": summary["wall"], "commands": summary["commands"]}} | summary["steps"]
+    previous = {"(total)": {"duration": baseline["wall"], "commands": baseline["commands"]}} | baseline["steps"]
+    regressions = []
+    for name, entry in current.items():
+        if name not in previous:
+            continue
+        for kind, floor in (("duration", min_seconds), ("commands", 0)):
+            now, before = entry[kind][metric], previous[name][kind][metric]
+            if now - before > max(before * threshold, floor):
+                regressions.append({"step": name, "kind": kind, "baseline": before, "current": now,
+                                    "change": round((now - before) / before, 3) if before else None})
+    return regressions
+
+
+def save_baseline(path, summary):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(summary, f, indent=2)
+    return path
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
@@ -0,0 +1,153 @@
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT = "default"
+FAST = "fast"
+PROFILES = (DEFAULT, FAST)
+
+FAST_WINDOW_SIZE = (1920, 1080)
+
+# Requests dropped by the fast profile: images, media and web fonts
+BLOCKED_EXTENSIONS = (
+    "png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico",
+    "mp4", "webm", "ogg", "mp3", "wav",
+    "woff", "woff2", "ttf", "otf", "eot",
+)
+# Network.setBlockedURLs matches the whole URL, so cache-busting query strings such as ?ver= need their own pattern
+BLOCKED_URL_PATTERNS = [pattern for ext in BLOCKED_EXTENSIONS for pattern in (f"*.{ext}", f"*.{ext}?*")]
+
+NO_ANIMATION_STYLE_ID = "fast-profile-no-animations"
+NO_ANIMATION_SCRIPT = f"""
+(function () {{
+    if (document.getElementById('{NO_ANIMATION_STYLE_ID}')) return;
+    var style = document.createElement('style');
+    style.id = '{NO_ANIMATION_STYLE_ID}';
+    style.textContent = '*, *::before, *::after {{ animation: none !important; transition: none !important; '
+        + 'scroll-behavior: auto !important; caret-color: transparent !important; }}';
+    (document.head || document.documentElement).appendChild(style);
+}})();
+"""
+REMOVE_NO_ANIMATION_SCRIPT = f"""
+var style = document.getElementById('{NO_ANIMATION_STYLE_ID}');
+if (style) style.remove();
+"""
+
+
+class BrowserProfiles:
+    """Applies rendering profiles (default or fast) to browser options and live drivers"""
+
+    @staticmethod
+    def apply_chrome_options(options, profile):
+        """Configures ChromeOptions for the requested profile"""
+        if profile != FAST:
+            options.add_argument("--start-maximized")
+            return options
+
+        width, height = FAST_WINDOW_SIZE
+        options.add_argument("--headless=new")
+        options.add_argument(f"--window-size={width},{height}")
+        options.add_argument("--hide-scrollbars")
+        options.add_argument("--force-prefers-reduced-motion")
+        options.add_argument("--autoplay-policy=user-gesture-required")
+        options.page_load_strategy = "eager"
+        return options
+
+    @staticmethod
+    def apply_firefox_options(options, profile):
+        """Configures FirefoxOptions for the requested profile
+
+        Firefox has no request blocking without CDP: images and fonts are disabled by preference and media
+        preloading is turned off, but media that page scripts explicitly load is still downloaded.
+        """
+        if profile != FAST:
+            options.add_argument("--start-maximized")
+            return options
+
+        width, height = FAST_WINDOW_SIZE
+        options.add_argument("-headless")
+        options.add_argument(f"--width={width}")
+        options.add_argument(f"--height={height}")
+        options.set_preference("permissions.default.image", 2)
+        options.set_preference("gfx.downloadable_fonts.enabled", False)
+        options.set_preference("media.autoplay.default", 5)
+        options.set_preference("media.preload.default", 0)
+        options.set_preference("media.preload.auto", 0)
+        options.set_preference("ui.prefersReducedMotion", 1)
+        options.set_preference("toolkit.cosmeticAnimations.enabled", False)
+        options.page_load_strategy = "eager"
+        return options
+
+    @staticmethod
+    def on_driver_started(driver, profile):
+        """Applies the runtime parts of a profile that cannot be expressed as launch options"""
+        driver.browser_profile = profile
+        if profile != FAST or not hasattr(driver, "execute_cdp_cmd"):
+            return
+
+        # CDP settings only cover the tab that was current when they were sent; see switch_to_window
+        driver.profiled_windows = {driver.current_window_handle}
+        driver.no_animation_script_ids = {}
+        BrowserProfiles._apply_cdp_profile(driver, driver.current_window_handle)
+        logger.info("Fast browser profile applied: media blocked, animations disabled")
+
+    @staticmethod
+    def switch_to_window(driver, handle):
+        """Switches to a window and, under the fast profile on Chrome, applies the profile to it when first seen
+
+        Tabs opened later (target=_blank links) have already started loading their first document, so that
+        document only receives the animation style directly; its images and fonts were not blocked.
+        """
+        driver.switch_to.window(handle)
+        windows = getattr(driver, "profiled_windows", None)
+        if windows is None or handle in windows:
+            return
+        windows.add(handle)
+        BrowserProfiles._apply_cdp_profile(driver, handle)
+        driver.execute_script(NO_ANIMATION_SCRIPT)
+
+    @staticmethod
+    def prepare_page(driver):
+        """Disables animations on the current document for browsers without init-script support
+
+        Page objects call this after every navigation. On Chrome it is a no-op: the init script covers every
+        document of the windows the profile was applied to, which switch_to_window extends to new tabs.
+        """
+        if getattr(driver, "browser_profile", DEFAULT) == FAST and not hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_script(NO_ANIMATION_SCRIPT)
+
+    @staticmethod
+    @contextmanager
+    def full_fidelity(driver):
+        """Temporarily restores full rendering for steps that depend on images, fonts or animations"""
+        if getattr(driver, "browser_profile", DEFAULT) != FAST:
+            yield driver
+            return
+
+        logger.info("Switching to full-fidelity rendering")
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+            driver.execute_cdp_cmd(
+                "Page.removeScriptToEvaluateOnNewDocument",
+                {"identifier": driver.no_animation_script_ids.pop(driver.current_window_handle)},
+            )
+        else:
+            logger.warning("Images and fonts stay blocked in Firefox; only animations are restored")
+        driver.execute_script(REMOVE_NO_ANIMATION_SCRIPT)
+
+        try:
+            yield driver
+        finally:
+            if hasattr(driver, "execute_cdp_cmd"):
+                BrowserProfiles._apply_cdp_profile(driver, driver.current_window_handle)
+            driver.execute_script(NO_ANIMATION_SCRIPT)
+            logger.info("Fast rendering restored")
+
+    @staticmethod
+    def _apply_cdp_profile(driver, handle):
+        """Blocks media and registers the no-animation init script for the current window"""
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        result = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": NO_ANIMATION_SCRIPT})
+        driver.no_animation_script_ids[handle] = result["identifier"]
@@ -0,0 +1,119 @@
+import logging
+from selenium.webdriver.common.by import By
+
+logger = logging.getLogger(__name__)
+
+# Shared element lookup for scripts that receive {by, value} locator specs
+FINDER_SCRIPT = """
+function byXPath(xpath) {
+    var result = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+    return nodes;
+}
+function literal(text) {
+    if (text.indexOf("'") < 0) return "'" + text + "'";
+    return 'concat(' + text.split("'").map(function (part) { return "'" + part + "'"; }).join(", \\"'\\", ") + ')';
+}
+function find(spec) {
+    switch (spec.by) {
+        case 'css selector': return Array.prototype.slice.call(document.querySelectorAll(spec.value));
+        case 'xpath': return byXPath(spec.value);
+        case 'link text': return byXPath('//a[normalize-space(.)=' + literal(spec.value) + ']');
+        case 'partial link text': return byXPath('//a[contains(., ' + literal(spec.value) + ')]');
+    }
+    throw new Error('Unsupported locator strategy: ' + spec.by);
+}
+"""
+
+SNAPSHOT_SCRIPT = FINDER_SCRIPT + """
+var specs = arguments[0], fields = arguments[1], attributes = arguments[2], maxText = arguments[3];
+
+function visible(element) {
+    if (element.checkVisibility) {
+        return element.checkVisibility({opacityProperty: true, visibilityProperty: true});
+    }
+    var style = getComputedStyle(element), rect = element.getBoundingClientRect();
+    return style.display !== 'none' && style.visibility !== 'hidden' && style.opacity !== '0'
+        && rect.width > 0 && rect.height > 0;
+}
+function text(element) {
+    return (element.innerText || element.textContent || '').trim().slice(0, maxText);
+}
+function describe(element) {
+    var rect = element.getBoundingClientRect();
+    var record = {
+        visible: visible(element),
+        text: text(element),
+        rect: [Math.round(rect.x), Math.round(rect.y), Math.round(rect.width), Math.round(rect.height)]
+    };
+    if (attributes.length) {
+        record.attributes = {};
+        attributes.forEach(function (name) { record.attributes[name] = element.getAttribute(name); });
+    }
+    if (fields) {
+        record.fields = {};
+        Object.keys(fields).forEach(function (name) {
+            var child = element.querySelector(fields[name]);
+            record.fields[name] = child ? text(child) : null;
+        });
+    }
+    return record;
+}
+
+var snapshot = {};
+Object.keys(specs).forEach(function (name) {
+    var elements = find(specs[name]);
+    if (!specs[name].all) elements = elements.slice(0, 1);
+    snapshot[name] = elements.map(describe);
+});
+return snapshot;
+"""
+
+# Strategies that translate to CSS before they reach the page
+_CSS_TRANSLATIONS = {
+    By.ID: lambda value: f"[id=\"{value}\"]",
+    By.CLASS_NAME: lambda value: f".{value}",
+    By.TAG_NAME: lambda value: value,
+    By.NAME: lambda value: f"[name=\"{value}\"]",
+}
+
+
+def script_locator(locator):
+    """Converts a (By, value) tuple into the {by, value} spec understood by FINDER_SCRIPT"""
+    by, value = locator
+    if by in _CSS_TRANSLATIONS:
+        by, value = By.CSS_SELECTOR, _CSS_TRANSLATIONS[by](value)
+    return {"by": by, "value": value}
+
+
+class DomSnapshot:
+    """Reads visibility, text, attributes and geometry for many locators in a single script call"""
+
+    @staticmethod
+    def capture(driver, locators, all_matches=(), fields=None, attributes=(), max_text=500):
+        """Returns {name: [element records]} for each (By, value) locator
+
+        Only the first match is described unless the name is listed in all_matches.
+        fields maps names to CSS selectors read relative to every matched element.
+        """
+        specs = {}
+        for name, locator in locators.items():
+            specs[name] = dict(script_locator(locator), all=name in all_matches)
+
+        if fields:
+            fields = {name: DomSnapshot._css(locator) for name, locator in fields.items()}
+
+        snapshot = driver.execute_script(SNAPSHOT_SCRIPT, specs, fields, list(attributes), max_text)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DOM snapshot captured: %s", {name: len(records) for name, records in snapshot.items()})
+        return snapshot
+
+    @staticmethod
+    def _css(locator):
+        by, value = locator
+        if by == By.CSS_SELECTOR:
+            return value
+        if by in _CSS_TRANSLATIONS:
+            return _CSS_TRANSLATIONS[by](value)
+        raise ValueError(f"Relative snapshot fields must be CSS-compatible locators, got: {by}")
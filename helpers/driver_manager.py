@@ -2,68 +2,200 @@ import logging
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
+from helpers.browser_profiles import BrowserProfiles, DEFAULT
+from helpers.driver_resolver import DriverResolver
+from helpers.wait_engine import WaitEngine
 import platform
-import os
-from datetime import datetime
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Clears the current document's Web Storage and returns its origin
+CLEAR_STORAGE_SCRIPT = "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {} return location.origin;"
+
 class DriverManager:
     """Manages WebDriver instances and configurations"""
     
     @staticmethod
-    def get_driver(browser="chrome"):
-        """Creates and returns a WebDriver instance based on the specified browser"""
-        logger.info(f"Initializing WebDriver instance for {browser} browser")
+    def get_driver(browser="chrome", profile=DEFAULT, network_mode="live"):
+        """Creates and returns a WebDriver instance based on the specified browser, rendering profile and network mode
+
+        network_mode "record" enables the performance log used by TrafficRecorder; "replay" blocks every host
+        except the local replay server (Chrome only).
+        """
+        logger.info("Initializing WebDriver instance for %s browser with %s profile (%s network)", browser, profile, network_mode)
         
         if browser.lower() == "chrome":
             options = webdriver.ChromeOptions()
-            options.add_argument("--start-maximized")
+            BrowserProfiles.apply_chrome_options(options, profile)
             options.add_argument("--disable-notifications")
+            if network_mode == "record":
+                options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            elif network_mode == "replay":
+                options.add_argument("--host-resolver-rules=MAP * ~NOTFOUND , EXCLUDE 127.0.0.1")
             
             # Handle ARM64 architecture on macOS
             if platform.system() == "Darwin" and platform.machine() == "arm64":
                 options.binary_location = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
                 options.add_argument("--no-sandbox")
                 options.add_argument("--disable-dev-shm-usage")
-                
-                # Set ChromeDriver path for ARM64
-                driver_path = os.path.expanduser("~/.wdm/drivers/chromedriver/mac64/134.0.6998.165/chromedriver-mac-arm64/chromedriver")
-                if not os.path.exists(driver_path):
-                    driver_path = ChromeDriverManager().install()
-                
-                return webdriver.Chrome(service=ChromeService(driver_path), options=options)
             
-            return webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
+            driver_path = DriverResolver.resolve("chrome", options.binary_location or None)
+            driver = webdriver.Chrome(service=ChromeService(driver_path), options=options)
+            BrowserProfiles.on_driver_started(driver, profile)
+            return driver
             
         elif browser.lower() == "firefox":
             options = webdriver.FirefoxOptions()
-            options.add_argument("--start-maximized")
-            return webdriver.Firefox(service=FirefoxService(GeckoDriverManager().install()), options=options)
+            BrowserProfiles.apply_firefox_options(options, profile)
+            driver_path = DriverResolver.resolve("firefox")
+            driver = webdriver.Firefox(service=FirefoxService(driver_path), options=options)
+            BrowserProfiles.on_driver_started(driver, profile)
+            return driver
        
         else:
-            logger.error(f"Unsupported browser type specified: {browser}")
+            logger.error("Unsupported browser type specified: %s", browser)
             raise ValueError(f"Unsupported browser type specified: {browser}")
 
     @staticmethod
-    def quit_driver(driver, test_name=None):
-        """Safely quits the WebDriver instance after capturing screenshot if test failed"""
+    def quit_driver(driver):
+        """Safely quits the WebDriver instance"""
         if driver:
             try:
-                # Capture screenshot if test failed
-                if test_name:
-                    screenshots_dir = "screenshots"
-                    if not os.path.exists(screenshots_dir):
-                        os.makedirs(screenshots_dir)
-                    
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    screenshot_path = os.path.join(screenshots_dir, f"{test_name}_{timestamp}.png")
-                    driver.save_screenshot(screenshot_path)
-                    logger.info(f"Screenshot captured and saved to: {screenshot_path}")
-                
                 driver.quit()
                 logger.info("WebDriver instance terminated successfully")
             except Exception as e:
-                logger.error(f"Error occurred while quitting WebDriver: {str(e)}") 
\ No newline at end of file
+                logger.error("Error occurred while quitting WebDriver: %s", e)
+
+
+class DriverPool:
+    """Hands out warm WebDriver instances and recycles them between tests"""
+
+    def __init__(self, browser="chrome", profile=DEFAULT, max_uses=20, max_size=1, state_cache=None, network_mode="live"):
+        self.browser = browser
+        self.profile = profile
+        self.network_mode = network_mode
+        self.state_cache = state_cache
+        self.max_uses = max_uses
+        self.max_size = max_size
+        self._idle = []
+        self._uses = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "recycled": 0, "unhealthy": 0, "startup_times": []}
+
+    def acquire(self):
+        """Returns a clean WebDriver, reusing an idle one when available and preloading cached session state"""
+        driver = self._checkout()
+        if self.state_cache:
+            try:
+                self.state_cache.apply(driver)
+            except Exception as e:
+                logger.warning("Failed to restore cached session state: %s", e)
+        return driver
+
+    def _checkout(self):
+        with self._lock:
+            while self._idle:
+                driver = self._idle.pop()
+                if self._is_healthy(driver):
+                    self.stats["hits"] += 1
+                    self._uses[id(driver)] += 1
+                    logger.info("Reusing pooled %s WebDriver (use %s/%s)", self.browser, self._uses[id(driver)], self.max_uses)
+                    return driver
+                self.stats["unhealthy"] += 1
+                self._discard(driver)
+
+            self.stats["misses"] += 1
+            start = time.perf_counter()
+            driver = DriverManager.get_driver(self.browser, self.profile, self.network_mode)
+            elapsed = time.perf_counter() - start
+            self.stats["startup_times"].append(elapsed)
+            self._uses[id(driver)] = 1
+            logger.info("Started new pooled %s WebDriver in %.2fs", self.browser, elapsed)
+            return driver
+
+    def release(self, driver):
+        """Resets and returns a WebDriver to the pool, recycling it when worn out or unhealthy"""
+        with self._lock:
+            if self._uses.get(id(driver), 0) >= self.max_uses:
+                logger.info("Recycling WebDriver after %s uses", self._uses[id(driver)])
+                self.stats["recycled"] += 1
+                self._discard(driver)
+                return
+
+            if not self._reset(driver):
+                self.stats["unhealthy"] += 1
+                self._discard(driver)
+                return
+
+            if len(self._idle) >= self.max_size:
+                self._discard(driver)
+                return
+
+            self._idle.append(driver)
+
+    def close_all(self):
+        """Quits every idle WebDriver held by the pool"""
+        with self._lock:
+            while self._idle:
+                self._discard(self._idle.pop())
+
+    def report(self):
+        """Returns pool hit/miss and startup-time statistics"""
+        startup_times = self.stats["startup_times"]
+        return {
+            "browser": self.browser,
+            "profile": self.profile,
+            "hits": self.stats["hits"],
+            "misses": self.stats["misses"],
+            "recycled": self.stats["recycled"],
+            "unhealthy": self.stats["unhealthy"],
+            "startups": len(startup_times),
+            "total_startup_seconds": round(sum(startup_times), 3),
+            "avg_startup_seconds": round(sum(startup_times) / len(startup_times), 3) if startup_times else 0.0,
+        }
+
+    def _discard(self, driver):
+        self._uses.pop(id(driver), None)
+        DriverManager.quit_driver(driver)
+
+    @staticmethod
+    def _is_healthy(driver):
+        """Checks that the browser still responds to commands"""
+        try:
+            return bool(driver.window_handles) and driver.execute_script("return 1;") == 1
+        except Exception as e:
+            logger.warning("Pooled WebDriver failed health check: %s", e)
+            return False
+
+    @staticmethod
+    def _reset(driver):
+        """Closes extra tabs and clears cookies and storage left by the previous test
+
+        Storage is cleared for the origins open in each tab. Chrome also drops every cookie and, through CDP, all
+        other storage of those origins. Firefox has no equivalent, so cookies of domains other than the current one
+        and storage of origins no longer open survive until the driver is recycled.
+        """
+        try:
+            handles = driver.window_handles
+            origins = set()
+            for handle in reversed(handles):
+                driver.switch_to.window(handle)
+                origins.add(driver.execute_script(CLEAR_STORAGE_SCRIPT))
+                if handle != handles[0]:
+                    driver.close()
+
+            driver.delete_all_cookies()
+            driver.session_state_restored = False
+            WaitEngine.restore_script_timeout(driver)
+            if hasattr(driver, "execute_cdp_cmd"):
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                for origin in origins:
+                    if origin and origin != "null":
+                        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.warning("Failed to reset pooled WebDriver: %s", e)
+            return False
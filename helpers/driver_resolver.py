@@ -0,0 +1,180 @@
+import json
+import logging
+import os
+import platform
+import re
+import shutil
+import subprocess
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class DriverResolver:
+    """Maps installed browser versions to local driver binaries through a shared on-disk index"""
+
+    cache_dir = os.environ.get("DRIVER_CACHE_DIR", os.path.expanduser("~/.wdm"))
+    offline = os.environ.get("DRIVER_OFFLINE", "").lower() in ("1", "true", "yes")
+
+    BROWSER_BINARIES = {
+        "chrome": [
+            "google-chrome",
+            "google-chrome-stable",
+            "chromium",
+            "chromium-browser",
+            "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+        ],
+        "firefox": [
+            "firefox",
+            "/Applications/Firefox.app/Contents/MacOS/firefox",
+        ],
+    }
+    DRIVER_NAMES = {"chrome": "chromedriver", "firefox": "geckodriver"}
+
+    _resolved = {}
+
+    @classmethod
+    def resolve(cls, browser, binary_location=None):
+        """Returns the local driver path for the installed browser, resolving it at most once per run"""
+        key = (browser, binary_location)
+        driver_path = cls._resolved.get(key)
+        if driver_path:
+            return driver_path
+
+        start = time.perf_counter()
+        version = cls.browser_version(browser, binary_location)
+        index_key = f"{browser}:{cls._major(version)}"
+
+        with cls._locked_index() as index:
+            driver_path = index["drivers"].get(index_key)
+            if not driver_path or not os.path.exists(driver_path):
+                driver_path = cls._find_local_driver(browser, version)
+                if not driver_path:
+                    driver_path = cls._download_driver(browser, version)
+                index["drivers"][index_key] = driver_path
+
+        cls._resolved[key] = driver_path
+        logger.info("Resolved %s %s driver to %s in %.1fms", browser, version, driver_path, (time.perf_counter() - start) * 1000)
+        return driver_path
+
+    @classmethod
+    def browser_version(cls, browser, binary_location=None):
+        """Detects the installed browser version, using the shared index to skip repeated process launches"""
+        binary = binary_location or cls._find_browser_binary(browser)
+        if not binary:
+            logger.warning("Could not locate an installed %s binary", browser)
+            return "unknown"
+
+        mtime = os.path.getmtime(binary)
+        with cls._locked_index() as index:
+            cached = index["browsers"].get(binary)
+            if cached and cached["mtime"] == mtime:
+                return cached["version"]
+
+            version = cls._query_version(binary)
+            index["browsers"][binary] = {"mtime": mtime, "version": version}
+            return version
+
+    @classmethod
+    def clear(cls):
+        """Forgets resolved drivers in this process and removes the on-disk index"""
+        cls._resolved.clear()
+        index_path = os.path.join(cls.cache_dir, "driver_index.json")
+        if os.path.exists(index_path):
+            os.remove(index_path)
+
+    @classmethod
+    def _find_browser_binary(cls, browser):
+        for candidate in cls.BROWSER_BINARIES.get(browser, []):
+            path = candidate if os.path.isabs(candidate) else shutil.which(candidate)
+            if path and os.path.exists(path):
+                return path
+        return None
+
+    @staticmethod
+    def _query_version(binary):
+        try:
+            output = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning("Failed to query browser version from %s: %s", binary, e)
+            return "unknown"
+        match = re.search(r"\d+(\.\d+)+", output)
+        return match.group(0) if match else "unknown"
+
+    @staticmethod
+    def _major(version):
+        return version.split(".")[0]
+
+    @classmethod
+    def _find_local_driver(cls, browser, version):
+        """Searches the driver cache for a binary matching the browser's major version"""
+        driver_name = cls.DRIVER_NAMES[browser]
+        if platform.system() == "Windows":
+            driver_name += ".exe"
+
+        major = cls._major(version)
+        candidates = []
+        for root, _, files in os.walk(os.path.join(cls.cache_dir, "drivers")):
+            if driver_name in files:
+                path = os.path.join(root, driver_name)
+                if os.access(path, os.X_OK):
+                    candidates.append(path)
+
+        if browser == "chrome":
+            # ChromeDriver must match the browser's major version
+            pattern = re.compile(rf"[\\/]{re.escape(major)}\.[\d.]+[\\/]")
+            candidates = [path for path in candidates if pattern.search(path)]
+
+        return sorted(candidates)[-1] if candidates else None
+
+    @classmethod
+    def _download_driver(cls, browser, version):
+        if cls.offline:
+            raise RuntimeError(
+                f"No cached {cls.DRIVER_NAMES[browser]} for {browser} {version} under {cls.cache_dir} "
+                f"and offline mode is enabled"
+            )
+
+        logger.info("Downloading %s for %s %s", cls.DRIVER_NAMES[browser], browser, version)
+        if browser == "chrome":
+            from webdriver_manager.chrome import ChromeDriverManager
+            return ChromeDriverManager().install()
+        from webdriver_manager.firefox import GeckoDriverManager
+        return GeckoDriverManager().install()
+
+    @classmethod
+    @contextmanager
+    def _locked_index(cls):
+        """Yields the on-disk index under an exclusive lock and writes it back atomically"""
+        os.makedirs(cls.cache_dir, exist_ok=True)
+        index_path = os.path.join(cls.cache_dir, "driver_index.json")
+
+        with open(index_path + ".lock", "w") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                try:
+                    with open(index_path) as f:
+                        index = json.load(f)
+                except (OSError, ValueError):
+                    index = {}
+                index.setdefault("browsers", {})
+                index.setdefault("drivers", {})
+                snapshot = json.dumps(index, sort_keys=True)
+
+                yield index
+
+                if json.dumps(index, sort_keys=True) != snapshot:
+                    tmp_path = f"{index_path}.{os.getpid()}.tmp"
+                    with open(tmp_path, "w") as f:
+                        json.dump(index, f, indent=2, sort_keys=True)
+                    os.replace(tmp_path, index_path)
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -0,0 +1,210 @@
+import functools
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+PAGE_TIMING_SCRIPT = """
+var navigation = performance.getEntriesByType('navigation')[0];
+var resources = performance.getEntriesByType('resource').map(function (entry) {
+    return {name: entry.name, type: entry.initiatorType, duration: Math.round(entry.duration),
+            transferSize: entry.transferSize || 0};
+});
+return {
+    url: location.href,
+    navigation: navigation ? {
+        type: navigation.type,
+        responseEnd: Math.round(navigation.responseEnd),
+        domInteractive: Math.round(navigation.domInteractive),
+        domContentLoaded: Math.round(navigation.domContentLoadedEventEnd),
+        load: Math.round(navigation.loadEventEnd),
+        transferSize: navigation.transferSize || 0
+    } : null,
+    resources: resources
+};
+"""
+
+
+class StepRecorder:
+    """Records wall time, WebDriver command counts and wait-versus-action time for page-object steps"""
+
+    current = None
+
+    def __init__(self, test_name, slowest_resources=10):
+        self.test_name = test_name
+        self.slowest_resources = slowest_resources
+        self.origin = time.perf_counter()
+        self.steps = []
+        self.waits = []
+        self.page_loads = []
+        self.commands = 0
+        self._open_steps = []
+        self._seen_urls = set()
+        self._driver = None
+        self._internal = False
+
+    def attach(self, driver):
+        """Counts every WebDriver command issued through the driver and makes this the active recorder"""
+        original_execute = driver.execute
+        recorder = self
+
+        def execute(driver_command, params=None):
+            if not recorder._internal:
+                recorder.commands += 1
+                for step in recorder._open_steps:
+                    step["commands"] += 1
+            return original_execute(driver_command, params)
+
+        driver.execute = execute
+        driver.instrumentation_original_execute = original_execute
+        self._driver = driver
+        StepRecorder.current = self
+
+    def detach(self):
+        """Restores the driver and deactivates the recorder"""
+        if self._driver is not None and hasattr(self._driver, "instrumentation_original_execute"):
+            self._driver.execute = self._driver.instrumentation_original_execute
+            del self._driver.instrumentation_original_execute
+        self._driver = None
+        if StepRecorder.current is self:
+            StepRecorder.current = None
+
+    @contextmanager
+    def step(self, name):
+        """Times a step; nested steps are attributed to every enclosing step as well"""
+        record = {
+            "name": name,
+            "start": time.perf_counter() - self.origin,
+            "depth": len(self._open_steps),
+            "commands": 0,
+            "wait_seconds": 0.0,
+        }
+        self._open_steps.append(record)
+        try:
+            yield record
+        finally:
+            self._open_steps.pop()
+            record["duration"] = round(time.perf_counter() - self.origin - record["start"], 4)
+            record["start"] = round(record["start"], 4)
+            record["wait_seconds"] = round(record["wait_seconds"], 4)
+            record["action_seconds"] = round(max(record["duration"] - record["wait_seconds"], 0.0), 4)
+            self.steps.append(record)
+            if not self._open_steps:
+                self._collect_page_timings()
+
+    @property
+    def active_step(self):
+        """Name of the innermost open step, or None"""
+        return self._open_steps[-1]["name"] if self._open_steps else None
+
+    def record_wait(self, name, start, duration):
+        """Attributes time spent waiting to the open steps"""
+        self.waits.append({"name": name, "start": round(start - self.origin, 4), "duration": round(duration, 4)})
+        for step in self._open_steps:
+            step["wait_seconds"] += duration
+
+    def to_dict(self):
+        return {
+            "test": self.test_name,
+            "commands": self.commands,
+            "steps": sorted(self.steps, key=lambda step: step["start"]),
+            "waits": self.waits,
+            "page_loads": self.page_loads,
+        }
+
+    def summary_rows(self):
+        """Returns (name, duration, commands, wait, action) rows for top-level steps"""
+        return [
+            (step["name"], step["duration"], step["commands"], step["wait_seconds"], step["action_seconds"])
+            for step in sorted(self.steps, key=lambda step: step["start"])
+            if step["depth"] == 0
+        ]
+
+    def write(self, output_dir):
+        """Writes <test>.json and a Chrome trace-format <test>.trace.json; returns both paths"""
+        os.makedirs(output_dir, exist_ok=True)
+        json_path = os.path.join(output_dir, f"{self.test_name}.json")
+        trace_path = os.path.join(output_dir, f"{self.test_name}.trace.json")
+
+        with open(json_path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+        events = [
+            {
+                "name": step["name"], "cat": "step", "ph": "X", "pid": 1, "tid": 1,
+                "ts": int(step["start"] * 1e6), "dur": int(step["duration"] * 1e6),
+                "args": {"commands": step["commands"], "wait_seconds": step["wait_seconds"]},
+            }
+            for step in self.steps
+        ] + [
+            {
+                "name": wait["name"], "cat": "wait", "ph": "X", "pid": 1, "tid": 2,
+                "ts": int(wait["start"] * 1e6), "dur": int(wait["duration"] * 1e6),
+            }
+            for wait in self.waits
+        ]
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": 1, "args": {"name": "steps"}},
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": 2, "args": {"name": "waits"}},
+        ]
+        with open(trace_path, "w") as f:
+            json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f)
+
+        logger.info("Step timings written to: %s (trace: %s)", json_path, trace_path)
+        return json_path, trace_path
+
+    def _collect_page_timings(self):
+        """Stores Navigation/Resource Timing entries the first time a URL is seen"""
+        if self._driver is None:
+            return
+        self._internal = True
+        try:
+            timings = self._driver.execute_script(PAGE_TIMING_SCRIPT)
+        except Exception as e:
+            logger.debug("Could not collect page timings: %s", e)
+            return
+        finally:
+            self._internal = False
+
+        if not timings or timings["url"] in self._seen_urls:
+            return
+        self._seen_urls.add(timings["url"])
+        resources = timings["resources"]
+        self.page_loads.append({
+            "url": timings["url"],
+            "navigation": timings["navigation"],
+            "resource_count": len(resources),
+            "resource_transfer_bytes": sum(resource["transferSize"] for resource in resources),
+            "slowest_resources": sorted(resources, key=lambda resource: resource["duration"], reverse=True)[:self.slowest_resources],
+        })
+
+
+@contextmanager
+def step(name):
+    """Times a block against the active StepRecorder, if any"""
+    recorder = StepRecorder.current
+    if recorder is None:
+        yield None
+        return
+    with recorder.step(name) as record:
+        yield record
+
+
+def instrumented_step(name=None):
+    """Decorates a page-object method so it is recorded as a step named after the class and method"""
+    def decorator(method):
+        step_name = name or method.__qualname__
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            with step(step_name):
+                return method(*args, **kwargs)
+        return wrapper
+
+    if callable(name):
+        method, name = name, None
+        return decorator(method)
+    return decorator
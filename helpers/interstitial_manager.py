@@ -0,0 +1,101 @@
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Known overlays: the agent clicks `dismiss` as soon as `trigger` becomes visible, once per trigger element
+DEFAULT_RULES = [
+    {"name": "cookie_banner", "trigger": "#wt-cli-accept-all-btn", "dismiss": "#wt-cli-accept-all-btn"},
+    {"name": "agent_one_popup", "trigger": "div.ins-notification-content", "dismiss": "span.ins-close-button"},
+    {
+        "name": "push_prompt",
+        "trigger": "[class*='push'] .close, [id*='push'] .close, [class*='opt-in'] .close",
+        "dismiss": "[class*='push'] .close, [id*='push'] .close, [class*='opt-in'] .close",
+    },
+]
+
+AGENT_SCRIPT_TEMPLATE = """
+(function () {
+    if (window.__interstitials) return;
+    var rules = %s;
+    var state = window.__interstitials = {log: [], seen: new WeakSet()};
+
+    function visible(element) {
+        var rect = element.getBoundingClientRect();
+        var style = getComputedStyle(element);
+        return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+    }
+    function sweep() {
+        rules.forEach(function (rule) {
+            var trigger = document.querySelector(rule.trigger);
+            if (!trigger || state.seen.has(trigger) || !visible(trigger)) return;
+            var target = document.querySelector(rule.dismiss);
+            if (!target) return;
+            // The trigger can stay visible while its hide animation runs; do not click it again on every mutation
+            state.seen.add(trigger);
+            target.click();
+            state.log.push({name: rule.name, url: location.href, at: Date.now()});
+        });
+    }
+    var scheduled = false;
+    function schedule() {
+        if (scheduled) return;
+        scheduled = true;
+        requestAnimationFrame(function () { scheduled = false; sweep(); });
+    }
+    state.sweep = sweep;
+
+    function start() {
+        new MutationObserver(schedule).observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true, attributeFilter: ['class', 'style']
+        });
+        sweep();
+    }
+    if (document.documentElement) {
+        start();
+    } else {
+        document.addEventListener('DOMContentLoaded', start, {once: true});
+    }
+})();
+"""
+
+SWEEP_SCRIPT = """
+var state = window.__interstitials;
+if (!state) return null;
+state.sweep();
+return state.log.splice(0, state.log.length);
+"""
+
+
+class InterstitialManager:
+    """Installs an in-page agent that dismisses cookie banners and popups as soon as they appear"""
+
+    def __init__(self, driver, rules=None):
+        self.driver = driver
+        self.agent_script = AGENT_SCRIPT_TEMPLATE % json.dumps(rules or DEFAULT_RULES)
+        self.history = []
+
+    def install(self):
+        """Installs the agent for every new document (Chrome) or for the current document (other browsers)"""
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            if not getattr(self.driver, "interstitial_agent_installed", False):
+                self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": self.agent_script})
+                self.driver.interstitial_agent_installed = True
+                logger.info("Interstitial agent registered for new documents")
+        self.driver.execute_script(self.agent_script)
+
+    def sweep(self):
+        """Triggers an immediate non-blocking sweep and returns the overlays dismissed since the last call"""
+        dismissed = self.driver.execute_script(SWEEP_SCRIPT)
+        if dismissed is None:
+            self.driver.execute_script(self.agent_script)
+            dismissed = self.driver.execute_script(SWEEP_SCRIPT) or []
+
+        for entry in dismissed:
+            logger.info("Interstitial agent dismissed '%s' on %s", entry['name'], entry['url'])
+        self.history.extend(dismissed)
+        return [entry["name"] for entry in dismissed]
+
+    def dismissed(self):
+        """Returns every overlay dismissed so far as {name, url, at} records"""
+        return list(self.history)
@@ -0,0 +1,42 @@
+import logging
+from collections import namedtuple
+
+logger = logging.getLogger(__name__)
+
+JobListing = namedtuple("JobListing", ["title", "department", "location", "link"])
+
+
+class JobListingValidator:
+    """Checks a stream of JobListing records against expected filters without holding the stream in memory"""
+
+    def __init__(self, department=None, location=None, link_domains=None, max_reported=20):
+        self.department = department
+        self.location = location
+        self.link_domains = link_domains
+        self.max_reported = max_reported
+
+    def mismatch(self, listing):
+        """Returns the reasons a listing does not match the expected filters, or an empty list"""
+        reasons = []
+        if self.department and self.department not in (listing.department or ""):
+            reasons.append(f"department '{listing.department}' != '{self.department}'")
+        if self.location and self.location not in (listing.location or ""):
+            reasons.append(f"location '{listing.location}' != '{self.location}'")
+        if not listing.link:
+            reasons.append("missing link")
+        elif self.link_domains and not any(domain in listing.link for domain in self.link_domains):
+            reasons.append(f"link '{listing.link}' outside {list(self.link_domains)}")
+        return reasons
+
+    def validate(self, listings):
+        """Consumes the listings and returns {checked, mismatched, mismatches}; only the first max_reported are kept"""
+        report = {"checked": 0, "mismatched": 0, "mismatches": []}
+        for listing in listings:
+            report["checked"] += 1
+            reasons = self.mismatch(listing)
+            if reasons:
+                report["mismatched"] += 1
+                if len(report["mismatches"]) < self.max_reported:
+                    report["mismatches"].append({"listing": listing._asdict(), "reasons": reasons})
+        logger.info("Validated %s job listings: %s mismatched", report['checked'], report['mismatched'])
+        return report
@@ -0,0 +1,89 @@
+import logging
+import threading
+from selenium.common.exceptions import TimeoutException
+from helpers.dom_snapshot import FINDER_SCRIPT, script_locator
+from helpers.wait_engine import TimedWait
+
+logger = logging.getLogger(__name__)
+
+FIRST_MATCH_SCRIPT = FINDER_SCRIPT + """
+var specs = arguments[0];
+for (var i = 0; i < specs.length; i++) {
+    var elements;
+    try {
+        elements = find(specs[i]);
+    } catch (e) {
+        continue;
+    }
+    if (elements.length) return {index: i, elements: elements};
+}
+return null;
+"""
+
+
+class LocatorRegistry:
+    """Ranked locator alternatives that are tried together, with statistics on which strategy matched"""
+
+    _alternatives = {}
+    _matches = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def register(cls, name, primary, *alternatives):
+        """Registers ranked (By, value) alternatives for an element and returns the primary locator"""
+        with cls._lock:
+            cls._alternatives[name] = [primary, *alternatives]
+            cls._matches.setdefault(name, {})
+        return primary
+
+    @classmethod
+    def alternatives(cls, name):
+        """Returns the ranked (By, value) alternatives registered for an element"""
+        return list(cls._alternatives[name])
+
+    @classmethod
+    def find_all(cls, driver, name, timeout=10):
+        """Waits until any alternative matches and returns the elements of the highest-ranked match"""
+        locators = cls._alternatives[name]
+        specs = [script_locator(locator) for locator in locators]
+
+        try:
+            result = TimedWait(driver, timeout).until(lambda d: d.execute_script(FIRST_MATCH_SCRIPT, specs))
+        except TimeoutException:
+            cls._record(name, None)
+            raise TimeoutException(f"No locator for '{name}' matched within {timeout}s: {locators}")
+
+        cls._record(name, result["index"])
+        if result["index"] > 0:
+            logger.warning("Primary locator for '%s' did not match; used alternative %s", name, locators[result['index']])
+        return result["elements"]
+
+    @classmethod
+    def find(cls, driver, name, timeout=10):
+        """Returns the first element matched by any of the element's alternatives"""
+        return cls.find_all(driver, name, timeout)[0]
+
+    @classmethod
+    def report(cls):
+        """Returns match counts per element and strategy, flagging elements whose primary locator went stale"""
+        report = {}
+        with cls._lock:
+            for name, locators in cls._alternatives.items():
+                matches = cls._matches.get(name, {})
+                strategies = {
+                    ("none" if index is None else f"{locators[index][0]}={locators[index][1]}"): count
+                    for index, count in matches.items()
+                }
+                fallbacks = sum(count for index, count in matches.items() if index != 0)
+                report[name] = {
+                    "primary": f"{locators[0][0]}={locators[0][1]}",
+                    "matches": strategies,
+                    "stale_primary": fallbacks > 0 and not matches.get(0),
+                }
+        return report
+
+    @classmethod
+    def _record(cls, name, index):
+        with cls._lock:
+            matches = cls._matches.setdefault(name, {})
+            matches[index] = matches.get(index, 0) + 1
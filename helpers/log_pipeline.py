@@ -0,0 +1,134 @@
+import json
+import logging
+import logging.handlers
+import os
+import queue
+from helpers import parallel
+from helpers.instrumentation import StepRecorder
+
+CONSOLE_FORMAT = '%(asctime)s - %(levelname)s - [%(worker_id)s %(test_id)s] %(message)s'
+
+
+class LogContext:
+    """Tags records with the current test id, worker id and innermost instrumented step"""
+
+    test_id = None
+    worker_id = parallel.worker_id()
+
+    @classmethod
+    def current_step(cls):
+        recorder = StepRecorder.current
+        return recorder.active_step if recorder is not None else None
+
+
+class ContextFilter(logging.Filter):
+    """Copies the LogContext onto each record on the logging thread, before it is queued"""
+
+    def filter(self, record):
+        record.test_id = LogContext.test_id
+        record.worker_id = LogContext.worker_id
+        record.step = LogContext.current_step()
+        return True
+
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """Queues records unformatted so message interpolation happens on the listener thread
+
+    The queue never leaves the process, so records do not need to be made picklable first.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+class LazyFileHandler(logging.FileHandler):
+    """Creates the log file, and its directory, only when the first record is written"""
+
+    def __init__(self, filename):
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Renders one JSON object per record"""
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "worker": getattr(record, "worker_id", None),
+            "test": getattr(record, "test_id", None),
+            "step": getattr(record, "step", None),
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class LogPipeline:
+    """Queue-backed logging: callers only enqueue records, a listener thread formats and writes them"""
+
+    _listener = None
+    _handler = None
+
+    @classmethod
+    def start(cls, log_path, level=logging.INFO, module_levels=None, console=True, worker_id=None):
+        """Routes the root logger through a queue to a JSON-lines file and, optionally, the console"""
+        cls.stop()
+        if worker_id is not None:
+            LogContext.worker_id = worker_id
+        file_handler = LazyFileHandler(log_path)
+        file_handler.setFormatter(JsonLinesFormatter())
+        handlers = [file_handler]
+        if console:
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+            handlers.append(stream_handler)
+
+        log_queue = queue.SimpleQueue()
+        cls._handler = LazyQueueHandler(log_queue)
+        cls._handler.addFilter(ContextFilter())
+        cls._listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        cls._listener.start()
+
+        root = logging.getLogger()
+        root.setLevel(level)
+        root.addHandler(cls._handler)
+        for name, module_level in (module_levels or {}).items():
+            logging.getLogger(name).setLevel(module_level)
+
+    @classmethod
+    def flush(cls):
+        """Blocks until every record queued so far has been written"""
+        if cls._listener is not None:
+            cls._listener.stop()
+            cls._listener.start()
+
+    @classmethod
+    def stop(cls):
+        """Flushes queued records and closes the output handlers"""
+        if cls._listener is None:
+            return
+        logging.getLogger().removeHandler(cls._handler)
+        cls._listener.stop()
+        for handler in cls._listener.handlers:
+            handler.close()
+        cls._listener = None
+        cls._handler = None
+
+
+def parse_module_levels(specs):
+    """Parses ["helpers.wait_engine=DEBUG", ...] into {"helpers.wait_engine": "DEBUG"}"""
+    levels = {}
+    for spec in specs or ():
+        for item in spec.split(","):
+            name, _, level = item.partition("=")
+            if not level:
+                raise ValueError(f"Expected <logger>=<LEVEL>, got '{item}'")
+            levels[name.strip()] = level.strip().upper()
+    return levels
@@ -0,0 +1,96 @@
+import datetime
+import heapq
+import json
+import logging
+import os
+import uuid
+
+logger = logging.getLogger(__name__)
+
+LOG_FILE_NAME = "test_execution.jsonl"
+
+
+def worker_id(config=None):
+    """Returns the pytest-xdist worker id (gw0, gw1, ...) or 'main' outside a worker process"""
+    if config is not None and hasattr(config, "workerinput"):
+        return config.workerinput["workerid"]
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def is_worker(config):
+    """Returns True inside a pytest-xdist worker process"""
+    return hasattr(config, "workerinput")
+
+
+def strip_group_suffix(nodeid):
+    """Drops the @group suffix pytest-xdist appends to node ids under --dist loadgroup"""
+    base, separator, group = nodeid.rpartition("@")
+    return base if separator and not any(char in group for char in "[]/:") else nodeid
+
+
+def worker_screenshots_dir(root, worker):
+    """Returns where a worker stores screenshots: its own subdirectory under xdist, the root otherwise"""
+    return root if worker == "main" else os.path.join(root, worker)
+
+
+def new_session_dir(root="reports"):
+    """Returns a run directory name that is unique even for runs started within the same second"""
+    timestamp = datetime.datetime.now().strftime('%Y%m%d-%H%M%S')
+    return os.path.join(root, f"test_run_{timestamp}_{uuid.uuid4().hex[:6]}")
+
+
+def _read_records(log_path):
+    with open(log_path, errors="replace") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def merge_worker_logs(session_dir):
+    """Merges per-worker JSON-lines logs into one chronologically ordered log, streaming each file once"""
+    sources = []
+    for worker in sorted(os.listdir(session_dir)):
+        log_path = os.path.join(session_dir, worker, LOG_FILE_NAME)
+        if os.path.isfile(log_path):
+            sources.append(_read_records(log_path))
+
+    merged_path = os.path.join(session_dir, LOG_FILE_NAME)
+    with open(merged_path, "w") as f:
+        # Each worker writes its own records in order, so a k-way merge is enough
+        for record in heapq.merge(*sources, key=lambda record: record["ts"]):
+            f.write(json.dumps(record) + "\n")
+    return merged_path
+
+
+def write_artifact_index(session_dir, screenshots_dir):
+    """Writes artifact_index.json listing each worker's logs, timings and screenshots"""
+    index = {}
+    for worker in sorted(os.listdir(session_dir)):
+        worker_dir = os.path.join(session_dir, worker)
+        if not os.path.isdir(worker_dir):
+            continue
+        files = []
+        for root, _, names in os.walk(worker_dir):
+            files.extend(os.path.relpath(os.path.join(root, name), session_dir) for name in sorted(names))
+        worker_screenshots = worker_screenshots_dir(screenshots_dir, worker)
+        index[worker] = {
+            "files": files,
+            "screenshots": sorted(
+                path for path in (os.path.join(worker_screenshots, name) for name in os.listdir(worker_screenshots))
+                if os.path.isfile(path)
+            ) if os.path.isdir(worker_screenshots) else [],
+        }
+
+    index_path = os.path.join(session_dir, "artifact_index.json")
+    with open(index_path, "w") as f:
+        json.dump(index, f, indent=2)
+    return index_path
+
+
+def merge_session(session_dir, screenshots_dir):
+    """Builds the combined log and artifact index once all workers have finished"""
+    if not os.path.isdir(session_dir):
+        return
+    merged_log = merge_worker_logs(session_dir)
+    index_path = write_artifact_index(session_dir, screenshots_dir)
+    logger.info("Merged worker logs into %s; artifact index at %s", merged_log, index_path)
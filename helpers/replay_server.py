@@ -0,0 +1,226 @@
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Content types whose bodies get absolute URLs rewritten to the local server
+TEXT_CONTENT_TYPES = ("text/", "application/javascript", "application/json", "application/x-javascript", "image/svg+xml")
+
+# WebDriver commands that may leave the current document, so recorded bodies must be drained first
+NAVIGATING_COMMANDS = ("get", "clickElement", "close", "quit", "switchToWindow", "refresh", "goBack", "goForward")
+
+
+class TrafficArchive:
+    """On-disk archive of HTTP responses keyed by method and absolute URL"""
+
+    def __init__(self, archive_dir):
+        self.archive_dir = archive_dir
+        self.index_path = os.path.join(archive_dir, "index.json")
+        self.entries = {}
+        self._lock = threading.Lock()
+        if os.path.exists(self.index_path):
+            with open(self.index_path) as f:
+                self.entries = json.load(f)["entries"]
+
+    @property
+    def hosts(self):
+        """Returns every host that has at least one recorded response"""
+        return {urlsplit(key.split(" ", 1)[1]).netloc for key in self.entries}
+
+    def add(self, method, url, status, content_type, body):
+        """Stores a response body, deduplicated by content hash"""
+        digest = hashlib.sha1(body).hexdigest()
+        body_path = os.path.join(self.archive_dir, "bodies", digest)
+        with self._lock:
+            if not os.path.exists(body_path):
+                os.makedirs(os.path.dirname(body_path), exist_ok=True)
+                with open(body_path, "wb") as f:
+                    f.write(body)
+            self.entries[f"{method} {url}"] = {"status": status, "content_type": content_type, "body": digest}
+
+    def lookup(self, method, url):
+        """Returns (status, content_type, body) for a recorded URL, ignoring the query string as a fallback"""
+        entry = self.entries.get(f"{method} {url}") or self.entries.get(f"{method} {url.split('?')[0]}")
+        if not entry:
+            return None
+        with open(os.path.join(self.archive_dir, "bodies", entry["body"]), "rb") as f:
+            return entry["status"], entry["content_type"], f.read()
+
+    def save(self):
+        """Writes the index atomically"""
+        os.makedirs(self.archive_dir, exist_ok=True)
+        with self._lock:
+            tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"entries": self.entries}, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+        logger.info("Traffic archive saved with %s responses: %s", len(self.entries), self.index_path)
+
+
+class TrafficRecorder:
+    """Records responses seen by a Chrome driver into a TrafficArchive using the performance log"""
+
+    def __init__(self, archive):
+        self.archive = archive
+
+    def attach(self, driver):
+        """Drains captured responses before every command that may navigate away"""
+        if not hasattr(driver, "execute_cdp_cmd"):
+            raise ValueError("Traffic recording requires a Chromium-based browser")
+
+        driver.execute_cdp_cmd("Network.enable", {"maxTotalBufferSize": 200 * 1024 * 1024, "maxResourceBufferSize": 20 * 1024 * 1024})
+        # Requests whose loading has not finished yet, kept across drains by request id
+        driver.recording_requests = {}
+        original_execute = driver.execute
+        recorder = self
+
+        def execute(driver_command, params=None):
+            if driver_command in NAVIGATING_COMMANDS and not getattr(driver, "recording_drain_active", False):
+                recorder.drain(driver)
+            return original_execute(driver_command, params)
+
+        driver.execute = execute
+        driver.recording_original_execute = original_execute
+
+    def detach(self, driver):
+        """Drains remaining responses, saves the archive and restores the driver"""
+        self.drain(driver)
+        if hasattr(driver, "recording_original_execute"):
+            driver.execute = driver.recording_original_execute
+            del driver.recording_original_execute
+        driver.recording_requests = {}
+        self.archive.save()
+
+    def drain(self, driver):
+        """Copies bodies of responses that finished loading since the last drain into the archive"""
+        driver.recording_drain_active = True
+        try:
+            requests = driver.recording_requests
+            finished = []
+            for entry in driver.get_log("performance"):
+                message = json.loads(entry["message"])["message"]
+                params = message.get("params", {})
+                if message["method"] == "Network.requestWillBeSent":
+                    requests[params["requestId"]] = {"method": params["request"]["method"]}
+                elif message["method"] == "Network.responseReceived":
+                    response = params["response"]
+                    requests.setdefault(params["requestId"], {"method": "GET"}).update(
+                        url=response["url"], status=response["status"], content_type=response.get("mimeType", "")
+                    )
+                elif message["method"] == "Network.loadingFinished":
+                    finished.append(params["requestId"])
+                elif message["method"] == "Network.loadingFailed":
+                    requests.pop(params["requestId"], None)
+
+            recorded = 0
+            for request_id in finished:
+                request = requests.pop(request_id, None)
+                if not request or "url" not in request or not request["url"].startswith("http") or 300 <= request["status"] < 400:
+                    continue
+                try:
+                    result = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+                except Exception:
+                    # Bodies of other tabs and evicted resources are not retrievable
+                    continue
+                body = base64.b64decode(result["body"]) if result["base64Encoded"] else result["body"].encode("utf-8")
+                self.archive.add(request["method"], request["url"], request["status"], request["content_type"], body)
+                recorded += 1
+            logger.debug("Recorded %s responses; %s still loading", recorded, len(requests))
+        finally:
+            driver.recording_drain_active = False
+
+
+class ReplayServer:
+    """Serves a TrafficArchive from a local multi-threaded HTTP server with optional artificial latency"""
+
+    def __init__(self, archive, latency_ms=0, host="127.0.0.1", port=0):
+        self.archive = archive
+        self.latency_ms = latency_ms
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+        self.origin = f"http://{host}:{self._server.server_address[1]}"
+        self._host_set = archive.hosts
+        self._hosts = sorted(self._host_set, key=len, reverse=True)
+        self.stats = {"hits": 0, "misses": 0}
+
+    def start(self):
+        """Starts serving in a background thread"""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+        logger.info("Replay server serving %s responses at %s", len(self.archive.entries), self.origin)
+        return self
+
+    def stop(self):
+        """Stops the server and logs hit/miss statistics"""
+        self._server.shutdown()
+        self._server.server_close()
+        logger.info("Replay server stopped: %s", self.stats)
+
+    def url_for(self, live_url):
+        """Maps a live https://host/path URL onto the local server"""
+        parts = urlsplit(live_url)
+        return f"{self.origin}/{parts.netloc}{parts.path or '/'}" + (f"?{parts.query}" if parts.query else "")
+
+    def rewrite(self, body):
+        """Points absolute URLs for recorded hosts at the local server"""
+        text = body.decode("utf-8", errors="surrogateescape")
+        for host in self._hosts:
+            local = f"{self.origin}/{host}"
+            text = text.replace(f"https://{host}", local).replace(f"http://{host}", local)
+            text = text.replace(f"https:\\/\\/{host}", local.replace("/", "\\/"))
+        return text.encode("utf-8", errors="surrogateescape")
+
+    def _live_url(self, path, referer):
+        """Recovers the live URL from a local path, resolving root-relative paths through the Referer"""
+        segments = path.lstrip("/").split("/", 1)
+        if segments[0] in self._host_set:
+            return f"https://{segments[0]}/{segments[1] if len(segments) > 1 else ''}"
+        if referer and referer.startswith(self.origin):
+            referer_host = referer[len(self.origin):].lstrip("/").split("/", 1)[0]
+            return f"https://{referer_host}{path}"
+        return None
+
+    def _handler_class(self):
+        server = self
+
+        class ReplayHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self._replay("GET")
+
+            def do_POST(self):
+                self._replay("POST")
+
+            def _replay(self, method):
+                if server.latency_ms:
+                    time.sleep(server.latency_ms / 1000)
+
+                live_url = server._live_url(self.path, self.headers.get("Referer"))
+                response = server.archive.lookup(method, live_url) if live_url else None
+                if not response:
+                    server.stats["misses"] += 1
+                    self.send_error(404, f"Not recorded: {live_url or self.path}")
+                    return
+
+                server.stats["hits"] += 1
+                status, content_type, body = response
+                if content_type.startswith(TEXT_CONTENT_TYPES):
+                    body = server.rewrite(body)
+                self.send_response(status)
+                self.send_header("Content-Type", content_type or "application/octet-stream")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug("Replay server: " + format, *args)
+
+        return ReplayHandler
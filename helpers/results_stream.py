@@ -0,0 +1,142 @@
+import html
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+RESULTS_FILE_NAME = "results.jsonl"
+SUMMARY_FILE_NAME = "summary.json"
+REPORT_FILE_NAME = "report.html"
+MAX_LONGREPR_CHARS = 4000
+
+
+class ResultsStream:
+    """Appends one JSON line per finished test phase; artifacts are stored as paths, never inlined"""
+
+    def __init__(self, path, worker="main"):
+        self.path = path
+        self.worker = worker
+        self._file = None
+
+    def write(self, report, artifacts=(), steps=()):
+        """Writes the record for a pytest TestReport"""
+        record = {
+            "nodeid": report.nodeid,
+            "when": report.when,
+            "outcome": report.outcome,
+            "duration": round(report.duration, 4),
+            "stop": round(getattr(report, "stop", time.time()), 4),
+            "worker": self.worker,
+            "artifacts": list(artifacts),
+            "steps": [list(row) for row in steps],
+        }
+        if report.failed or report.skipped:
+            record["longrepr"] = str(report.longrepr)[-MAX_LONGREPR_CHARS:]
+        if self._file is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._file = open(self.path, "a", buffering=1)
+        self._file.write(json.dumps(record) + "\n")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+
+def read_results(paths):
+    """Yields records from one or more results files in file order"""
+    for path in paths:
+        if not os.path.isfile(path):
+            continue
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def collapse_outcome(outcomes):
+    """Collapses per-phase outcomes {when: outcome} into passed, failed, error or skipped"""
+    if outcomes.get("call") == "failed":
+        return "failed"
+    if "failed" in (outcomes.get("setup"), outcomes.get("teardown")):
+        return "error"
+    if "skipped" in outcomes.values():
+        return "skipped"
+    return "passed"
+
+
+def summarize(records):
+    """Reduces a results stream to per-outcome counts and an overall status"""
+    phases = {}
+    durations = 0.0
+    for record in records:
+        phases.setdefault(record["nodeid"], {})[record["when"]] = record["outcome"]
+        durations += record["duration"]
+
+    counts = {"passed": 0, "failed": 0, "error": 0, "skipped": 0}
+    for outcomes in phases.values():
+        counts[collapse_outcome(outcomes)] += 1
+    ok = counts["failed"] == 0 and counts["error"] == 0 and len(phases) > 0
+    return {"status": "passed" if ok else "failed", "total": len(phases), **counts,
+            "test_seconds": round(durations, 2)}
+
+
+def write_summary(path, summary):
+    """Writes summary.json atomically so readers never see a partial file"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(summary, f, indent=2)
+    os.replace(temp_path, path)
+    return path
+
+
+def build_html_report(records, path, summary):
+    """Renders the results stream as a static HTML page, one row per reported phase, linking artifacts"""
+    report_dir = os.path.dirname(os.path.abspath(path))
+    with open(path, "w") as f:
+        f.write("<!DOCTYPE html><html><head><meta charset='utf-8'><title>Test Report</title>"
+                "<style>body{font-family:sans-serif}td,th{border:1px solid #ccc;padding:4px;vertical-align:top}"
+                "table{border-collapse:collapse}.passed{color:green}.failed,.error{color:red}.skipped{color:gray}"
+                "pre{white-space:pre-wrap;max-height:20em;overflow:auto}</style></head><body>")
+        f.write(f"<h1>Test Report</h1><p>Status: <b class='{summary['status']}'>{summary['status']}</b> &mdash; "
+                + ", ".join(f"{summary[key]} {key}" for key in ("total", "passed", "failed", "error", "skipped"))
+                + f" ({summary['test_seconds']}s)</p>")
+        f.write("<table><tr><th>Test</th><th>Phase</th><th>Outcome</th><th>Duration (s)</th><th>Worker</th>"
+                "<th>Details</th></tr>")
+        for record in records:
+            if record["when"] != "call" and record["outcome"] == "passed" and not record["artifacts"]:
+                continue
+            f.write(f"<tr><td>{html.escape(record['nodeid'])}</td><td>{record['when']}</td>"
+                    f"<td class='{record['outcome']}'>{record['outcome']}</td><td>{record['duration']:.2f}</td>"
+                    f"<td>{html.escape(record['worker'])}</td><td>{_details(record, report_dir)}</td></tr>")
+        f.write("</table></body></html>")
+    return path
+
+
+def _details(record, report_dir):
+    parts = []
+    for artifact in record["artifacts"]:
+        href = html.escape(os.path.relpath(os.path.abspath(artifact), report_dir))
+        parts.append(f"<a href='{href}'>{html.escape(os.path.basename(artifact))}</a>")
+    if record["steps"]:
+        rows = "".join(
+            f"<tr><td>{html.escape(name)}</td><td>{duration:.2f}</td><td>{commands}</td><td>{wait:.2f}</td>"
+            f"<td>{action:.2f}</td></tr>"
+            for name, duration, commands, wait, action in record["steps"]
+        )
+        parts.append("<table><tr><th>Step</th><th>Wall (s)</th><th>Commands</th><th>Waiting (s)</th>"
+                     f"<th>Acting (s)</th></tr>{rows}</table>")
+    if record.get("longrepr"):
+        parts.append(f"<pre>{html.escape(record['longrepr'])}</pre>")
+    return "".join(parts)
+
+
+def publish(session_dir, result_paths):
+    """Builds summary.json and report.html in the session directory from the workers' results streams"""
+    os.makedirs(session_dir, exist_ok=True)
+    summary = summarize(read_results(result_paths))
+    summary_path = write_summary(os.path.join(session_dir, SUMMARY_FILE_NAME), summary)
+    report_path = build_html_report(read_results(result_paths), os.path.join(session_dir, REPORT_FILE_NAME), summary)
+    logger.info("Results summary written to %s (%s); HTML report at %s", summary_path, summary["status"], report_path)
+    return summary
@@ -0,0 +1,134 @@
+import json
+import logging
+import os
+import time
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Fields accepted by CDP Network.setCookies
+_CDP_COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+# Fields accepted by WebDriver add_cookie
+_WEBDRIVER_COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expiry")
+
+READ_STORAGE_SCRIPT = """
+function dump(storage) {
+    var data = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        data[key] = storage.getItem(key);
+    }
+    return data;
+}
+return {origin: location.origin, local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+SEED_STORAGE_TEMPLATE = """
+(function (state) {
+    if (location.origin !== state.origin) return;
+    try {
+        Object.keys(state.local).forEach(function (key) {
+            if (localStorage.getItem(key) === null) localStorage.setItem(key, state.local[key]);
+        });
+        Object.keys(state.session).forEach(function (key) {
+            if (sessionStorage.getItem(key) === null) sessionStorage.setItem(key, state.session[key]);
+        });
+    } catch (e) {}
+})(%s);
+"""
+
+
+class SessionStateCache:
+    """Persists cookies and web storage after a consent flow so later drivers can skip the warm-up steps"""
+
+    def __init__(self, path, ttl=1800):
+        self.path = path
+        self.ttl = ttl
+
+    def save(self, driver):
+        """Captures cookies and the current origin's local/session storage"""
+        if hasattr(driver, "execute_cdp_cmd"):
+            cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        else:
+            cookies = driver.get_cookies()
+        storage = driver.execute_script(READ_STORAGE_SCRIPT)
+
+        state = {
+            "created_at": time.time(),
+            "origin": storage["origin"],
+            "cookies": cookies,
+            "local_storage": storage["local"],
+            "session_storage": storage["session"],
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.path)
+        logger.info("Session state for %s saved to: %s (%s cookies)", state['origin'], self.path, len(cookies))
+
+    def load(self):
+        """Returns the cached state, or None when it is missing, unreadable or expired"""
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - state["created_at"] > self.ttl:
+            logger.info("Cached session state expired")
+            self.invalidate()
+            return None
+        return state
+
+    def invalidate(self):
+        """Deletes the cached state so the next run repeats the consent flow"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+            logger.info("Session state invalidated: %s", self.path)
+
+    def apply(self, driver):
+        """Loads cached state into the driver before its first navigation; returns True when applied"""
+        state = self.load()
+        if not state:
+            self._remove_seed_script(driver)
+            return False
+
+        seed_script = SEED_STORAGE_TEMPLATE % json.dumps({
+            "origin": state["origin"],
+            "local": state["local_storage"],
+            "session": state["session_storage"],
+        })
+
+        if hasattr(driver, "execute_cdp_cmd"):
+            cookies = [
+                {k: v for k, v in cookie.items() if k in _CDP_COOKIE_FIELDS and not (k == "expires" and v <= 0)}
+                for cookie in state["cookies"]
+            ]
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+            # Pooled drivers keep init scripts for their lifetime, so swap the seed script when the cache changes
+            installed = getattr(driver, "session_state_script", None)
+            if installed is None or installed["created_at"] != state["created_at"]:
+                self._remove_seed_script(driver)
+                identifier = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": seed_script})
+                driver.session_state_script = {"created_at": state["created_at"], "identifier": identifier["identifier"]}
+        else:
+            # Cookies can only be set for the current domain, so visit a lightweight page on the origin first
+            driver.get(f"{state['origin']}/robots.txt")
+            host = urlparse(state["origin"]).hostname
+            for cookie in state["cookies"]:
+                if host.endswith(cookie.get("domain", "").lstrip(".")):
+                    driver.add_cookie({k: v for k, v in cookie.items() if k in _WEBDRIVER_COOKIE_FIELDS})
+            driver.execute_script(seed_script)
+
+        driver.session_state_restored = True
+        logger.info("Session state for %s restored (%s cookies)", state['origin'], len(state['cookies']))
+        return True
+
+    @staticmethod
+    def _remove_seed_script(driver):
+        installed = getattr(driver, "session_state_script", None)
+        if installed is None:
+            return
+        driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": installed["identifier"]})
+        driver.session_state_script = None
@@ -0,0 +1,40 @@
+import os
+import re
+import subprocess
+import sys
+import time
+
+# Modules that only browser-driven tests need; importing any of them during collection is a regression
+HEAVY_MODULES = ("selenium", "webdriver_manager", "requests", "PIL")
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def profile_collection(pytest_args=("tests",), cwd=ROOT_DIR):
+    """Runs `pytest --collect-only` under -X importtime in a fresh interpreter
+
+    Returns {"wall_ms", "returncode", "imports": {top-level module: cumulative ms}, "heavy": [heavy modules loaded]}.
+    """
+    command = [sys.executable, "-X", "importtime", "-m", "pytest", "--collect-only", "-q",
+               "-p", "no:cacheprovider", "--capture=no", *pytest_args]
+    start = time.perf_counter()
+    completed = subprocess.run(command, cwd=cwd, capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    imports, heavy = {}, set()
+    for line in completed.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if not match:
+            continue
+        cumulative_us, indent, name = int(match.group(2)), match.group(3), match.group(4)
+        if name.split(".")[0] in HEAVY_MODULES:
+            heavy.add(name.split(".")[0])
+        if len(indent) <= 1:
+            imports[name] = imports.get(name, 0) + cumulative_us / 1000
+    return {"wall_ms": round(wall_ms, 1), "returncode": completed.returncode, "imports": imports,
+            "heavy": sorted(heavy)}
+
+
+def slowest_imports(imports, count=15):
+    """Returns the `count` top-level imports with the largest cumulative time"""
+    return sorted(imports.items(), key=lambda item: item[1], reverse=True)[:count]
@@ -2,7 +2,6 @@ import os
 import logging
 import pytest
 from datetime import datetime
-from pytest_html.extras import image, html
 
 logger = logging.getLogger(__name__)
 
@@ -10,8 +9,11 @@ class TestHelper:
     """Provides helper methods for test operations"""
     
     @staticmethod
-    def capture_screenshot(driver, test_name):
-        """Captures a screenshot and saves it to the screenshots directory"""
+    def capture_screenshot(driver, test_name, writer=None):
+        """Captures a screenshot and saves it to the screenshots directory, in the background when a writer is given"""
+        if writer:
+            return writer.capture(driver, test_name)
+
         screenshots_dir = getattr(pytest, "screenshots_dir", "screenshots")
         if not os.path.exists(screenshots_dir):
             os.makedirs(screenshots_dir)
@@ -19,22 +21,32 @@ class TestHelper:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         screenshot_path = os.path.join(screenshots_dir, f"{test_name}_{timestamp}.png")
         driver.save_screenshot(screenshot_path)
-        logger.info(f"Screenshot captured and saved to: {screenshot_path}")
+        logger.info("Screenshot captured and saved to: %s", screenshot_path)
         return screenshot_path
 
     @staticmethod
     def add_screenshot_to_report(request, screenshot_path):
-        """Adds screenshot to HTML report"""
-        if hasattr(request.node, "rep_call"):
-            request.node.rep_call.extra = [
-                image(screenshot_path),
-                html(f"<div>Screenshot: <a href='{screenshot_path}'>{request.node.name}.png</a></div>")
-            ]
+        """Attaches the screenshot path to the test so the results stream links it from the report"""
+        if not hasattr(request.node, "artifacts"):
+            request.node.artifacts = []
+        request.node.artifacts.append(screenshot_path)
 
     @staticmethod
-    def handle_test_failure(request, driver):
+    def handle_test_failure(request, driver, writer=None):
         """Handles test failure by capturing screenshot and adding to report"""
         if request.node.rep_call.failed if hasattr(request.node, "rep_call") else False:
-            screenshot_path = TestHelper.capture_screenshot(driver, request.node.name)
+            screenshot_path = TestHelper.capture_screenshot(driver, request.node.name, writer)
+            TestHelper.add_screenshot_to_report(request, screenshot_path)
+            logger.error("Test execution failed. Screenshot captured and saved at: %s", screenshot_path)
+
+    @staticmethod
+    def handle_test_teardown(request, driver, writer, policy="on-failure"):
+        """Captures a screenshot according to the capture policy: on-failure, always or none"""
+        if policy == "none":
+            return
+        failed = request.node.rep_call.failed if hasattr(request.node, "rep_call") else False
+        if failed:
+            TestHelper.handle_test_failure(request, driver, writer)
+        elif policy == "always":
+            screenshot_path = TestHelper.capture_screenshot(driver, request.node.name, writer)
             TestHelper.add_screenshot_to_report(request, screenshot_path)
-            logger.error(f"Test execution failed. Screenshot captured and saved at: {screenshot_path}") 
\ No newline at end of file
@@ -0,0 +1,87 @@
+import heapq
+import logging
+import os
+import sqlite3
+import time
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS durations (
+    nodeid TEXT NOT NULL,
+    browser TEXT NOT NULL,
+    duration REAL NOT NULL,
+    outcome TEXT NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_durations_test ON durations (nodeid, browser, recorded_at);
+"""
+
+
+class TimingDatabase:
+    """SQLite history of test durations per browser"""
+
+    def __init__(self, path, history=5):
+        self.path = path
+        self.history = history
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=30)
+        self._connection.executescript(SCHEMA)
+
+    def record(self, nodeid, browser, duration, outcome, recorded_at=None):
+        """Stores one test duration"""
+        with self._connection:
+            self._connection.execute(
+                "INSERT INTO durations (nodeid, browser, duration, outcome, recorded_at) VALUES (?, ?, ?, ?, ?)",
+                (nodeid, browser, duration, outcome, time.time() if recorded_at is None else recorded_at),
+            )
+
+    def expected_durations(self):
+        """Returns {(nodeid, browser): mean duration over the most recent runs}"""
+        rows = self._connection.execute(
+            """
+            SELECT nodeid, browser, AVG(duration) FROM (
+                SELECT nodeid, browser, duration,
+                       ROW_NUMBER() OVER (PARTITION BY nodeid, browser ORDER BY recorded_at DESC, rowid DESC) AS age
+                FROM durations
+            ) WHERE age <= ? GROUP BY nodeid, browser
+            """,
+            (self.history,),
+        ).fetchall()
+        return {(nodeid, browser): duration for nodeid, browser, duration in rows}
+
+    def close(self):
+        self._connection.close()
+
+
+def longest_first(tests, durations, default=None):
+    """Sorts (key, test) pairs by expected duration, slowest first; unknown tests use the mean known duration"""
+    if default is None:
+        default = sum(durations.values()) / len(durations) if durations else 0.0
+    return sorted(tests, key=lambda pair: durations.get(pair[0], default), reverse=True)
+
+
+def longest_first_grouped(tests, durations, group, default=None):
+    """Sorts slowest-first within each group, keeping groups contiguous in order of first appearance
+
+    Used to keep session-scoped parameters such as the browser together, so their fixtures are built once.
+    """
+    if default is None:
+        default = sum(durations.values()) / len(durations) if durations else 0.0
+    groups = {}
+    for key, test in tests:
+        groups.setdefault(group(key), []).append((key, test))
+    return [pair for members in groups.values() for pair in longest_first(members, durations, default)]
+
+
+def pack_bins(tests, durations, bins, default=None):
+    """Greedy longest-processing-time bin packing of (key, test) pairs into `bins` balanced groups"""
+    if default is None:
+        default = sum(durations.values()) / len(durations) if durations else 0.0
+    heap = [(0.0, index, []) for index in range(bins)]
+    for key, test in longest_first(tests, durations, default):
+        load, index, members = heapq.heappop(heap)
+        members.append(test)
+        heapq.heappush(heap, (load + durations.get(key, default), index, members))
+    return [members for _, _, members in sorted(heap, key=lambda entry: entry[1])]
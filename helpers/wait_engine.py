@@ -0,0 +1,241 @@
+import logging
+import time
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from helpers.instrumentation import StepRecorder
+
+logger = logging.getLogger(__name__)
+
+# Every script receives its arguments followed by a timeout in ms and the WebDriver callback.
+# It reports back {ok: bool, detail: string} once the condition holds or the timeout expires.
+_SCRIPT_PRELUDE = """
+var done = arguments[arguments.length - 1];
+var timeoutMs = arguments[arguments.length - 2];
+var finished = false;
+function finish(ok, detail) {
+    if (finished) return;
+    finished = true;
+    done({ok: ok, detail: detail || ''});
+}
+setTimeout(function () { finish(false, 'timeout'); }, timeoutMs);
+"""
+
+SCROLLED_INTO_VIEW_SCRIPT = _SCRIPT_PRELUDE + """
+var element = arguments[0];
+element.scrollIntoView({block: 'center'});
+var observer = new IntersectionObserver(function (entries) {
+    if (entries.some(function (entry) { return entry.isIntersecting; })) {
+        observer.disconnect();
+        // Two animation frames let the scroll position and layout settle
+        requestAnimationFrame(function () { requestAnimationFrame(function () { finish(true); }); });
+    }
+});
+observer.observe(element);
+"""
+
+DOM_SETTLED_SCRIPT = _SCRIPT_PRELUDE + """
+var root = arguments[0] || document.documentElement;
+var quietMs = arguments[1];
+var timer = null;
+var observer = new MutationObserver(arm);
+function arm() {
+    clearTimeout(timer);
+    timer = setTimeout(function () { observer.disconnect(); finish(true); }, quietMs);
+}
+function start() {
+    observer.observe(root, {childList: true, subtree: true});
+    arm();
+}
+if (document.readyState === 'complete') {
+    start();
+} else {
+    window.addEventListener('load', start, {once: true});
+}
+"""
+
+NETWORK_IDLE_SCRIPT = _SCRIPT_PRELUDE + """
+var idleMs = arguments[0];
+if (!window.__waitEngineNetwork) {
+    var tracker = window.__waitEngineNetwork = {inflight: 0, lastActivity: performance.now()};
+    var touch = function (delta) { tracker.inflight += delta; tracker.lastActivity = performance.now(); };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            touch(1);
+            return originalFetch.apply(this, arguments).finally(function () { touch(-1); });
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        touch(1);
+        this.addEventListener('loadend', function () { touch(-1); }, {once: true});
+        return originalSend.apply(this, arguments);
+    };
+    new PerformanceObserver(function () { tracker.lastActivity = performance.now(); })
+        .observe({type: 'resource', buffered: false});
+}
+var tracker = window.__waitEngineNetwork;
+(function check() {
+    if (finished) return;
+    var quiet = performance.now() - tracker.lastActivity;
+    if (document.readyState === 'complete' && tracker.inflight <= 0 && quiet >= idleMs) {
+        finish(true);
+    } else {
+        setTimeout(check, Math.max(idleMs - quiet, 50));
+    }
+})();
+"""
+
+SELECT2_OPTIONS_SCRIPT = _SCRIPT_PRELUDE + """
+var selectId = arguments[0];
+function populated() {
+    var select = document.getElementById(selectId);
+    return !!select && Array.prototype.some.call(select.options, function (option) {
+        return option.value && option.value !== 'All';
+    });
+}
+if (populated()) {
+    finish(true);
+} else {
+    var observer = new MutationObserver(function () {
+        if (populated()) { observer.disconnect(); finish(true); }
+    });
+    observer.observe(document.documentElement, {childList: true, subtree: true});
+}
+"""
+
+PREDICATE_SCRIPT = _SCRIPT_PRELUDE + """
+var predicate = new Function(arguments[0]);
+var predicateArgs = arguments[1];
+function check() {
+    try {
+        return predicate.apply(null, predicateArgs);
+    } catch (e) {
+        return false;
+    }
+}
+if (check()) {
+    finish(true);
+} else {
+    var scheduled = false;
+    var observer = new MutationObserver(function () {
+        if (scheduled) return;
+        scheduled = true;
+        requestAnimationFrame(function () {
+            scheduled = false;
+            if (check()) { observer.disconnect(); finish(true); }
+        });
+    });
+    observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+}
+"""
+
+
+class WaitEngine:
+    """Event-driven waits resolved inside the page through a single asynchronous script call"""
+
+    timings = []
+
+    def __init__(self, driver, timeout=30):
+        self.driver = driver
+        self.timeout = timeout
+
+    def scrolled_into_view(self, element, timeout=None):
+        """Scrolls the element to the viewport centre and waits until it is intersecting"""
+        self._run("scrolled_into_view", SCROLLED_INTO_VIEW_SCRIPT, [element], timeout)
+
+    def dom_settled(self, root=None, quiet_ms=300, timeout=None):
+        """Waits for the page to finish loading and no nodes to be added or removed for quiet_ms"""
+        self._run("dom_settled", DOM_SETTLED_SCRIPT, [root, quiet_ms], timeout)
+
+    def network_idle(self, idle_ms=500, timeout=None):
+        """Waits until no fetch/XHR is in flight and no resource has loaded for idle_ms"""
+        self._run("network_idle", NETWORK_IDLE_SCRIPT, [idle_ms], timeout)
+
+    def select2_options_populated(self, select_id, timeout=None):
+        """Waits until the select backing a select2 widget has options besides 'All'"""
+        self._run(f"select2_options_populated[{select_id}]", SELECT2_OPTIONS_SCRIPT, [select_id], timeout)
+
+    def until_script(self, name, predicate_body, args=(), timeout=None):
+        """Waits until a JavaScript predicate body (receiving args) returns true, re-checking on DOM mutations"""
+        self._run(f"until_script[{name}]", PREDICATE_SCRIPT, [predicate_body, list(args)], timeout)
+
+    @classmethod
+    def summary(cls):
+        """Returns total time and call count per wait type"""
+        summary = {}
+        for record in cls.timings:
+            name = record["wait"].split("[")[0]
+            entry = summary.setdefault(name, {"count": 0, "seconds": 0.0, "timeouts": 0})
+            entry["count"] += 1
+            entry["seconds"] = round(entry["seconds"] + record["seconds"], 3)
+            entry["timeouts"] += 0 if record["ok"] else 1
+        return summary
+
+    @classmethod
+    def reset(cls):
+        """Clears recorded wait timings"""
+        cls.timings.clear()
+
+    @staticmethod
+    def restore_script_timeout(driver):
+        """Puts back the script timeout the driver had before any wait raised it"""
+        original = getattr(driver, "wait_original_script_timeout", None)
+        if original is not None and driver.wait_script_timeout != original:
+            driver.set_script_timeout(original)
+            driver.wait_script_timeout = original
+
+    def _ensure_script_timeout(self, seconds):
+        """Raises the script timeout to at least `seconds`, skipping the round trip when it is already enough"""
+        current = getattr(self.driver, "wait_script_timeout", None)
+        if current is None:
+            # Read once per driver so restore_script_timeout can put it back; None means no limit
+            original = self.driver.timeouts.script
+            self.driver.wait_original_script_timeout = original
+            current = float("inf") if original is None else original
+        if current < seconds:
+            self.driver.set_script_timeout(seconds)
+            current = seconds
+        self.driver.wait_script_timeout = current
+
+    def _run(self, name, script, args, timeout):
+        timeout = timeout or self.timeout
+        self._ensure_script_timeout(timeout + 5)
+
+        start = time.perf_counter()
+        result = self.driver.execute_async_script(script, *args, int(timeout * 1000))
+        elapsed = time.perf_counter() - start
+
+        ok = bool(result and result.get("ok"))
+        _record_wait(name, start, elapsed, ok)
+        logger.debug("Wait '%s' finished in %.3fs (ok=%s)", name, elapsed, ok)
+
+        if not ok:
+            raise TimeoutException(f"Wait '{name}' did not complete within {timeout}s")
+
+
+class TimedWait(WebDriverWait):
+    """WebDriverWait that records the time spent polling alongside WaitEngine timings"""
+
+    def until(self, method, message=""):
+        return self._timed("until", super().until, method, message)
+
+    def until_not(self, method, message=""):
+        return self._timed("until_not", super().until_not, method, message)
+
+    def _timed(self, kind, wait, method, message):
+        name = f"{kind}[{getattr(method, '__name__', type(method).__name__)}]"
+        start = time.perf_counter()
+        ok = False
+        try:
+            result = wait(method, message)
+            ok = True
+            return result
+        finally:
+            _record_wait(name, start, time.perf_counter() - start, ok)
+
+
+def _record_wait(name, start, elapsed, ok):
+    WaitEngine.timings.append({"wait": name, "seconds": round(elapsed, 4), "ok": ok})
+    if StepRecorder.current is not None:
+        StepRecorder.current.record_wait(name, start, elapsed)
@@ -1,7 +1,11 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+from selenium.common.exceptions import TimeoutException
+from helpers.browser_profiles import BrowserProfiles
+from helpers.dom_snapshot import DomSnapshot
+from helpers.instrumentation import instrumented_step
+from helpers.locator_registry import LocatorRegistry
+from helpers.wait_engine import TimedWait, WaitEngine
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,42 +13,66 @@ logger = logging.getLogger(__name__)
 class CareersPage:
     """Page Object Model for Insider Careers Page"""
 
+    URL = "https://useinsider.com/careers/"
+
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 5)
+        self.wait = TimedWait(driver, 5)
+        self.waits = WaitEngine(driver, timeout=5)
+
+        self.locations_section = LocatorRegistry.register("CareersPage.locations_section", (By.ID, "career-our-location"))
+        self.teams_section = LocatorRegistry.register("CareersPage.teams_section", (By.XPATH, "//section[@data-id='a8e7b90']"))
+        self.life_at_insider_section = LocatorRegistry.register("CareersPage.life_at_insider_section", (By.ID, "find-job-widget"))
 
-        self.locations_section = (By.ID, "career-our-location")
-        self.teams_section = (By.XPATH, "//section[@data-id='a8e7b90']")
-        self.life_at_insider_section = (By.ID, "find-job-widget")
+    @instrumented_step
+    def open(self, url=URL, interstitials=None):
+        """Opens the Careers page directly, for drivers that already carry consent state
 
+        When an InterstitialManager is given, its agent is installed the same way HomePage.open_page does.
+        """
+        if interstitials and hasattr(self.driver, "execute_cdp_cmd"):
+            interstitials.install()
+        self.driver.get(url)
+        logger.info("Navigated to URL: %s", url)
+        self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        BrowserProfiles.prepare_page(self.driver)
+        if interstitials:
+            interstitials.install()
+
+    @instrumented_step
     def verify_sections(self):
         """Verifies the visibility of specified sections on the Careers page"""
         logger.info("Step 4: Verifying Careers page sections")
+        sections = {
+            "Locations": self.locations_section,
+            "Teams": self.teams_section,
+            "Life at Insider": self.life_at_insider_section,
+        }
+
+        logger.info("Step 4.1: Waiting for all sections to be present")
+        self.wait.until(lambda driver: self._snapshot_if(sections, lambda records: records))
         
-        logger.info("Step 4.1: Verifying Locations section")
-        locations_element = self.wait.until(EC.presence_of_element_located(self.locations_section))
-        self._scroll_to_element_and_wait(locations_element)
-        self.wait.until(EC.visibility_of_element_located(self.locations_section))
-        assert locations_element.is_displayed(), "Locations section is not visible!"
-        logger.info("Locations section displayed successfully")
-        
-        logger.info("Step 4.2: Verifying Teams section")
-        teams_element = self.wait.until(EC.presence_of_element_located(self.teams_section))
-        self._scroll_to_element_and_wait(teams_element)
-        self.wait.until(EC.visibility_of_element_located(self.teams_section))
-        assert teams_element.is_displayed(), "Teams section is not visible!"
-        logger.info("Teams section displayed successfully")
+        logger.info("Step 4.2: Scrolling through sections to trigger lazy rendering")
+        for locator in sections.values():
+            self._scroll_to_element_and_wait(self.driver.find_element(*locator))
+
+        logger.info("Step 4.3: Verifying section visibility")
+        try:
+            snapshot = self.wait.until(lambda driver: self._snapshot_if(sections, lambda records: records[0]["visible"]))
+        except TimeoutException:
+            snapshot = DomSnapshot.capture(self.driver, sections)
         
-        logger.info("Step 4.3: Verifying Life at Insider section")
-        life_element = self.wait.until(EC.presence_of_element_located(self.life_at_insider_section))
-        self._scroll_to_element_and_wait(life_element)
-        self.wait.until(EC.visibility_of_element_located(self.life_at_insider_section))
-        assert life_element.is_displayed(), "Life at Insider section is not visible!"
-        logger.info("Life at Insider section displayed successfully")
+        for name, records in snapshot.items():
+            assert records[0]["visible"], f"{name} section is not visible!"
+            logger.info("%s section displayed successfully", name)
+
+    def _snapshot_if(self, locators, condition):
+        """Returns a DOM snapshot when every locator's records satisfy the condition, otherwise False"""
+        snapshot = DomSnapshot.capture(self.driver, locators)
+        return snapshot if all(records and condition(records) for records in snapshot.values()) else False
 
     def _scroll_to_element_and_wait(self, element):
-        """Scrolls to the specified element and waits for a fixed duration"""
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(1)
+        """Scrolls to the specified element and waits until it is in the viewport"""
+        self.waits.scrolled_into_view(element)
 
    
\ No newline at end of file
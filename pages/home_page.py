@@ -1,7 +1,11 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
+from helpers.browser_profiles import BrowserProfiles
+from helpers.instrumentation import instrumented_step
+from helpers.interstitial_manager import InterstitialManager
+from helpers.locator_registry import LocatorRegistry
+from helpers.wait_engine import TimedWait
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,76 +15,77 @@ class HomePage:
 
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 5)
+        self.wait = TimedWait(driver, 5)
         self.actions = ActionChains(driver)
+        self.interstitials = InterstitialManager(driver)
         logger.info("HomePage object initialized")
 
-        self.cookie_accept_button = (By.ID, "wt-cli-accept-all-btn")
-        self.push_notification_close = (By.CLASS_NAME, "close")
-        self.company_menu = (By.XPATH, "//li[contains(@class, 'nav-item dropdown')][6]")
-        self.careers_link = (By.XPATH, "//a[@href='https://useinsider.com/careers/']")
-        self.agent_one_popup = (By.CSS_SELECTOR, "div.ins-notification-content")
-        self.agent_one_close = (By.CSS_SELECTOR, "span.ins-close-button")
+        self.cookie_accept_button = LocatorRegistry.register("HomePage.cookie_accept_button", (By.ID, "wt-cli-accept-all-btn"))
+        self.push_notification_close = LocatorRegistry.register("HomePage.push_notification_close", (By.CLASS_NAME, "close"))
+        self.company_menu = LocatorRegistry.register(
+            "HomePage.company_menu",
+            (By.XPATH, "//li[contains(@class, 'nav-item dropdown')][6]"),
+            (By.XPATH, "//li[contains(@class, 'dropdown')][a[normalize-space()='Company']]"),
+        )
+        self.careers_link = LocatorRegistry.register(
+            "HomePage.careers_link",
+            (By.XPATH, "//a[@href='https://useinsider.com/careers/']"),
+            (By.CSS_SELECTOR, "a[href$='/careers/']"),
+        )
+        self.agent_one_popup = LocatorRegistry.register("HomePage.agent_one_popup", (By.CSS_SELECTOR, "div.ins-notification-content"))
+        self.agent_one_close = LocatorRegistry.register("HomePage.agent_one_close", (By.CSS_SELECTOR, "span.ins-close-button"))
 
+    @instrumented_step
     def handle_agent_one_popup(self):
-        """Handles and closes the Agent One popup if present"""
-        try:
-            short_wait = WebDriverWait(self.driver, 2)
-            popup = short_wait.until(EC.presence_of_element_located(self.agent_one_popup))
-            if popup.is_displayed():
-                logger.info("Step 1.1: Closing Agent One popup")
-                close_button = self.driver.find_element(*self.agent_one_close)
-                self.driver.execute_script("arguments[0].click();", close_button)
-                short_wait.until(EC.invisibility_of_element_located(self.agent_one_popup))
-                logger.info("Agent One popup closed successfully")
-        except:
-            pass
+        """Closes the Agent One popup if the interstitial agent finds it"""
+        if "agent_one_popup" in self.interstitials.sweep():
+            logger.info("Step 1.1: Agent One popup closed successfully")
 
+    @instrumented_step
     def open_page(self, url):
-        """Opens the specified URL and waits for the page to load"""
+        """Opens the specified URL with the interstitial agent installed and waits for the page to load"""
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            self.interstitials.install()
         self.driver.get(url)
-        logger.info(f"Navigated to URL: {url}")
+        logger.info("Navigated to URL: %s", url)
         self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        BrowserProfiles.prepare_page(self.driver)
+        self.interstitials.install()
         assert url in self.driver.current_url, f"Page failed to load: {url}"
 
+    @instrumented_step
     def accept_cookies(self):
-        """Accepts the cookie notification"""
+        """Accepts the cookie notification through the interstitial agent without blocking"""
         logger.info("Step 2: Accepting cookie notification")
-        try:
-            accept_button = self.wait.until(EC.element_to_be_clickable(self.cookie_accept_button))
-            accept_button.click()
-            self.wait.until(EC.invisibility_of_element_located(self.cookie_accept_button))
+        if "cookie_banner" in self.interstitials.sweep():
             logger.info("Cookie notification accepted successfully")
-        except Exception:
-            logger.info("Cookie notification not visible or already accepted")
+        else:
+            logger.info("Cookie notification not visible yet; the interstitial agent will accept it when it appears")
 
+    @instrumented_step
     def close_push_notification(self):
-        """Closes the push notification if present"""
-        try:
-            push_close_button = self.wait.until(EC.element_to_be_clickable(self.push_notification_close))
-            push_close_button.click()
+        """Closes the push notification if the interstitial agent finds it"""
+        if "push_prompt" in self.interstitials.sweep():
             logger.info("Push notification closed successfully")
-        except Exception:
-            pass
 
+    @instrumented_step
     def navigate_to_careers(self):
         """Hovers over the 'Company' menu and clicks the 'Careers' option"""
         logger.info("Step 3: Navigating to Careers page")
-        self.close_push_notification()
-        self.handle_agent_one_popup()
+        self.interstitials.sweep()
 
-        company_menu = self.wait.until(EC.presence_of_element_located(self.company_menu))
+        company_menu = LocatorRegistry.find(self.driver, "HomePage.company_menu", timeout=5)
         self.actions.move_to_element(company_menu).perform()
         logger.info("Hovered over Company menu")
-        
-        self.handle_agent_one_popup()
 
-        self.wait.until(EC.visibility_of_element_located(self.careers_link))
-        assert self.driver.find_element(*self.careers_link).is_displayed(), "Careers link is not visible!"
+        careers_link = LocatorRegistry.find(self.driver, "HomePage.careers_link", timeout=5)
+        self.wait.until(EC.visibility_of(careers_link))
+        assert careers_link.is_displayed(), "Careers link is not visible!"
 
-        careers_link = self.wait.until(EC.element_to_be_clickable(self.careers_link))
+        careers_link = self.wait.until(EC.element_to_be_clickable(careers_link))
         careers_link.click()
         logger.info("Clicked Careers link")
 
-        self.driver.switch_to.window(self.driver.window_handles[-1])
+        BrowserProfiles.switch_to_window(self.driver, self.driver.window_handles[-1])
+        BrowserProfiles.prepare_page(self.driver)
         logger.info("Successfully navigated to Careers page")
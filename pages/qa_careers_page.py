@@ -1,52 +1,162 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import TimeoutException
+from helpers.browser_profiles import BrowserProfiles
+from helpers.dom_snapshot import DomSnapshot
+from helpers.instrumentation import instrumented_step
+from helpers.job_listing_validator import JobListing, JobListingValidator
+from helpers.link_validator import DEFAULT_DOMAINS, DEFAULT_TITLE_KEYWORDS, LinkValidator
+from helpers.locator_registry import LocatorRegistry
+from helpers.wait_engine import TimedWait, WaitEngine
 import logging
+import random
 
 logger = logging.getLogger(__name__)
 
+SELECT_FILTERS_SCRIPT = """
+var selections = arguments[0];
+var applied = {};
+for (var i = 0; i < selections.length; i++) {
+    var select = document.getElementById(selections[i].id);
+    if (!select) return {error: 'Filter not found: ' + selections[i].id};
+    var option = Array.prototype.find.call(select.options, function (option) {
+        return option.text.indexOf(selections[i].text) >= 0;
+    });
+    if (!option) return {error: 'No option containing "' + selections[i].text + '" in ' + selections[i].id};
+    if (window.jQuery) {
+        // select2 and the page's listing filter both listen for jQuery change events
+        window.jQuery(select).val(option.value).trigger('change');
+    } else {
+        select.value = option.value;
+        select.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+    applied[selections[i].id] = option.text;
+}
+return {applied: applied};
+"""
+
+READ_JOB_BATCH_SCRIPT = """
+var selector = arguments[0], fields = arguments[1], offset = arguments[2], limit = arguments[3];
+var items = document.querySelectorAll(selector);
+var batch = [];
+for (var i = offset; i < Math.min(items.length, offset + limit); i++) {
+    var record = [];
+    for (var f = 0; f < fields.length; f++) {
+        var child = items[i].querySelector(fields[f]);
+        record.push(child ? (child.textContent || '').trim() : null);
+    }
+    var link = items[i].querySelector('a[href]');
+    record.push(link ? link.href : null);
+    batch.push(record);
+}
+if (offset + batch.length >= items.length && items.length) {
+    items[items.length - 1].scrollIntoView({block: 'end'});
+}
+return {total: items.length, batch: batch, container: items.length ? items[0].parentElement : null};
+"""
+
+JOB_LIST_MATCHES_PREDICATE = """
+var department = arguments[0], location = arguments[1];
+var items = document.querySelectorAll('#jobs-list .position-list-item');
+if (!items.length) return false;
+return Array.prototype.every.call(items, function (item) {
+    var itemDepartment = item.querySelector('.position-department');
+    var itemLocation = item.querySelector('.position-location');
+    return !!itemDepartment && itemDepartment.textContent.indexOf(department) >= 0
+        && (!location || (!!itemLocation && itemLocation.textContent.indexOf(location) >= 0));
+});
+"""
+
 class QACareersPage:
     """Page Object Model for Insider QA Careers Page"""
 
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 5)
+        self.wait = TimedWait(driver, 5)
+        self.waits = WaitEngine(driver, timeout=30)
         self.actions = ActionChains(driver)
         
-        self.location_filter = (By.ID, "select2-filter-by-location-container")
-        self.department_filter = (By.ID, "select2-filter-by-department-container")
-        self.job_listings = (By.CSS_SELECTOR, ".position-list-item")
-        self.view_role_buttons = (By.XPATH, "//a[contains(text(),'View Role')]")
-        self.open_positions_link = (By.LINK_TEXT, "See all QA jobs")
-        self.dream_job_button = (By.XPATH, "//a[contains(@class, 'btn-info') and contains(text(), 'Find your dream job')]")
+        self.location_filter = LocatorRegistry.register("QACareersPage.location_filter", (By.ID, "select2-filter-by-location-container"))
+        self.department_filter = LocatorRegistry.register("QACareersPage.department_filter", (By.ID, "select2-filter-by-department-container"))
+        self.job_listings = LocatorRegistry.register("QACareersPage.job_listings", (By.CSS_SELECTOR, ".position-list-item"))
+        self.job_title = (By.CSS_SELECTOR, ".position-title")
+        self.job_department = (By.CSS_SELECTOR, ".position-department")
+        self.job_location = (By.CSS_SELECTOR, ".position-location")
+        self.view_role_buttons = LocatorRegistry.register(
+            "QACareersPage.view_role_buttons",
+            (By.XPATH, "//a[contains(text(),'View Role')]"),
+            (By.CSS_SELECTOR, ".position-list-item-wrapper a.btn"),
+        )
+        self.open_positions_link = LocatorRegistry.register("QACareersPage.open_positions_link", (By.LINK_TEXT, "See all QA jobs"))
+        self.dream_job_button = LocatorRegistry.register(
+            "QACareersPage.dream_job_button",
+            (By.XPATH, "//a[contains(@class, 'btn-info') and contains(text(), 'Find your dream job')]"),
+            (By.PARTIAL_LINK_TEXT, "dream job"),
+        )
 
+    @instrumented_step
     def navigate_to_qa_careers(self):
         """Navigates to the QA Careers page"""
         logger.info("Step 5: Navigating to QA Careers page")
         
-        dream_job_button = self.wait.until(EC.presence_of_element_located(self.dream_job_button))
+        dream_job_button = LocatorRegistry.find(self.driver, "QACareersPage.dream_job_button", timeout=5)
         self.wait.until(EC.element_to_be_clickable(dream_job_button))
         
         self.driver.execute_script("arguments[0].click();", dream_job_button)
         logger.info("Clicked 'Find your dream job' button")
 
-        self.driver.switch_to.window(self.driver.window_handles[-1])
+        BrowserProfiles.switch_to_window(self.driver, self.driver.window_handles[-1])
         logger.info("Successfully navigated to QA Careers page")
 
         self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        BrowserProfiles.prepare_page(self.driver)
         logger.info("QA Careers page loaded successfully")
         
-    def filter_jobs(self, location, department):
-        """Filters job listings by location and department"""
-        logger.info(f"Step 6: Filtering job listings - Location: {location}, Department: {department}")
-        wait = WebDriverWait(self.driver, 30)
+    @instrumented_step
+    def filter_jobs(self, location, department, ui=False, timeout=30):
+        """Filters job listings by location and department
+
+        By default the underlying selects are set in one script call; ui=True drives the select2 dropdowns
+        for runs where the widget interaction itself is under test.
+        """
+        if ui:
+            return self._filter_jobs_via_ui(location, department)
+
+        logger.info("Step 6: Filtering job listings programmatically - Location: %s, Department: %s", location, department)
+        self.waits.select2_options_populated("filter-by-location")
+        self.waits.select2_options_populated("filter-by-department")
+
+        result = self.driver.execute_script(SELECT_FILTERS_SCRIPT, [
+            {"id": "filter-by-location", "text": location},
+            {"id": "filter-by-department", "text": department},
+        ])
+        assert "error" not in result, result.get("error")
+        logger.info("Filters applied: %s", result['applied'])
+
+        self.waits.until_script("job_list_filtered", JOB_LIST_MATCHES_PREDICATE, [department, location], timeout=timeout)
+        logger.info("Job list re-rendered for the selected filters")
+
+    def sweep_filters(self, combinations, timeout=15):
+        """Applies each (location, department) combination in turn and yields it with the matching JobListings"""
+        for location, department in combinations:
+            try:
+                self.filter_jobs(location, department, timeout=timeout)
+                jobs = list(self.iter_job_listings())
+            except (AssertionError, TimeoutException) as e:
+                logger.info("No matching listings for %s / %s: %s", location, department, e)
+                jobs = []
+            yield location, department, jobs
+
+    def _filter_jobs_via_ui(self, location, department):
+        """Filters job listings by driving the select2 dropdowns"""
+        logger.info("Step 6: Filtering job listings - Location: %s, Department: %s", location, department)
+        wait = TimedWait(self.driver, 30)
         
         logger.info("Step 6.1: Selecting location filter")
         location_dropdown = wait.until(EC.element_to_be_clickable(self.location_filter))
-        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", location_dropdown)
-        wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-        wait.until(lambda driver: len(driver.find_elements(By.XPATH, "//select[@id='filter-by-location']/option[not(@value='All')]")) > 0)
+        self.waits.scrolled_into_view(location_dropdown)
+        self.waits.select2_options_populated("filter-by-location")
         logger.info("Location filter options loaded")
         
         location_dropdown.click()
@@ -60,15 +170,12 @@ class QACareersPage:
         wait.until(EC.visibility_of_element_located((By.XPATH, location_xpath)))
         location_option = wait.until(EC.element_to_be_clickable((By.XPATH, location_xpath)))
         location_option.click()
-        logger.info(f"Location filter selected: {location}")
+        logger.info("Location filter selected: %s", location)
         
         logger.info("Step 6.2: Selecting department filter")
-        wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-        
         department_dropdown = wait.until(EC.element_to_be_clickable(self.department_filter))
-        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", department_dropdown)
-        wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-        wait.until(lambda driver: len(driver.find_elements(By.XPATH, "//select[@id='filter-by-department']/option[not(@value='All')]")) > 0)
+        self.waits.scrolled_into_view(department_dropdown)
+        self.waits.select2_options_populated("filter-by-department")
         logger.info("Department filter options loaded")
         
         department_dropdown.click()
@@ -82,60 +189,142 @@ class QACareersPage:
         wait.until(EC.visibility_of_element_located((By.XPATH, department_xpath)))
         department_option = wait.until(EC.element_to_be_clickable((By.XPATH, department_xpath)))
         department_option.click()
-        logger.info(f"Department filter selected: {department}")
+        logger.info("Department filter selected: %s", department)
 
-    def verify_job_listings(self, department):
-        """Verifies the presence of filtered job listings"""
+    @instrumented_step
+    def verify_job_listings(self, department, location=None):
+        """Verifies that every filtered job listing is visible and matches the department and location"""
         logger.info("Step 7: Verifying filtered job listings")
         
-        self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-        long_wait = WebDriverWait(self.driver, 45)
+        self.waits.dom_settled()
+        long_wait = TimedWait(self.driver, 45)
         
         department_selector = (By.XPATH, f"//div[@id='jobs-list']//span[contains(@class, 'position-department') and contains(text(), '{department}')]")
         long_wait.until(EC.presence_of_element_located(department_selector))
-        logger.info(f"Selected department '{department}' displayed in job list")
+        logger.info("Selected department '%s' displayed in job list", department)
         
-        job_items = self.wait.until(EC.presence_of_all_elements_located(self.job_listings))
-        job_count = len(job_items)
+        jobs = self._snapshot_job_listings()
+        job_count = len(jobs)
         assert job_count > 0, "No job listings found matching the specified filters!"
-        logger.info(f"Found {job_count} job listings matching the filters")
+        logger.info("Found %s job listings matching the filters", job_count)
+        
+        for i, job in enumerate(jobs):
+            assert job["visible"], f"Job listing {i+1} is not visible!"
         
-        for i, job in enumerate(job_items[:3]):
-            self.wait.until(EC.visibility_of(job))
-            assert job.is_displayed(), f"Job listing {i+1} is not visible!"
-            logger.info(f"Job listing {i+1} displayed successfully")
+        report = JobListingValidator(department=department, location=location).validate(self.iter_job_listings())
+        assert report["checked"] >= job_count, f"Only {report['checked']} of {job_count} job listings could be read!"
+        assert report["mismatched"] == 0, \
+            f"{report['mismatched']} of {report['checked']} job listings do not match the filters: {report['mismatches']}"
+        logger.info("All %s job listings displayed with the expected department and location", report['checked'])
+
+    def iter_job_listings(self, batch_size=50, settle_ms=200, load_timeout=3):
+        """Yields JobListing records in page order, reading in batches and picking up lazy-loaded items
 
-    def verify_view_role_buttons(self):
-        """Verifies the presence and functionality of 'View Role' buttons"""
+        Only one batch is held at a time, so memory stays flat regardless of the number of positions.
+        At the end of the list one short quiet period lets lazy loading append more; settle_ms=0 skips it.
+        """
+        selector = self.job_listings[1]
+        fields = [self.job_title[1], self.job_department[1], self.job_location[1]]
+        offset = 0
+        settled = False
+        while True:
+            result = self.driver.execute_script(READ_JOB_BATCH_SCRIPT, selector, fields, offset, batch_size)
+            for record in result["batch"]:
+                yield JobListing(*record)
+            offset += len(result["batch"])
+
+            if offset < result["total"]:
+                continue
+            if not settle_ms or (settled and not result["batch"]):
+                return
+            try:
+                # Reading the last batch scrolled the last item into view; the list has grown if nodes arrive
+                self.waits.dom_settled(root=result["container"], quiet_ms=settle_ms, timeout=load_timeout)
+            except TimeoutException:
+                return
+            settled = True
+
+    def _snapshot_job_listings(self):
+        """Captures the visibility of every job listing in one script call, waiting briefly for fade-in to finish"""
+        def capture(driver):
+            return DomSnapshot.capture(driver, {"jobs": self.job_listings}, all_matches=("jobs",), max_text=0)["jobs"]
+
+        def all_visible(driver):
+            jobs = capture(driver)
+            return jobs if jobs and all(job["visible"] for job in jobs) else False
+
+        try:
+            return self.wait.until(all_visible)
+        except TimeoutException:
+            return capture(self.driver)
+
+    @instrumented_step
+    def collect_view_role_links(self):
+        """Reads the href of every 'View Role' link in one DOM read, using the first locator alternative that matches"""
+        alternatives = LocatorRegistry.alternatives("QACareersPage.view_role_buttons")
+        snapshot = DomSnapshot.capture(
+            self.driver,
+            {str(index): locator for index, locator in enumerate(alternatives)},
+            all_matches=[str(index) for index in range(len(alternatives))],
+            attributes=("href",),
+            max_text=0,
+        )
+        for index in range(len(alternatives)):
+            links = [record["attributes"]["href"] for record in snapshot[str(index)] if record["attributes"]["href"]]
+            if links:
+                return links
+        return []
+
+    @instrumented_step
+    def validate_view_role_links(self, validator=None):
+        """Validates every 'View Role' target concurrently over HTTP instead of clicking through each one"""
+        logger.info("Step 8: Validating all 'View Role' links")
+        links = self.collect_view_role_links()
+        assert links, "'View Role' links not found!"
+
+        validator = validator or LinkValidator()
+        try:
+            results = validator.validate(links)
+        finally:
+            validator.close()
+
+        failures = [result for result in results if not result["ok"]]
+        assert not failures, f"{len(failures)} of {len(results)} 'View Role' links are invalid: " + ", ".join(
+            f"{result['url']} (status={result['status']}, final={result['final_url']}, error={result['error']})"
+            for result in failures
+        )
+        logger.info("All %s 'View Role' links verified", len(results))
+        return results
+
+    @instrumented_step
+    def verify_view_role_buttons(self, sample_index=0, seed=None):
+        """Verifies the browser click path of one 'View Role' button: sample_index, or a listing drawn with seed"""
         logger.info("Step 8: Verifying 'View Role' buttons")
         
-        self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-        long_wait = WebDriverWait(self.driver, 45)
+        self.waits.dom_settled()
+        long_wait = TimedWait(self.driver, 45)
         
         job_items = long_wait.until(EC.presence_of_all_elements_located(self.job_listings))
         assert len(job_items) > 0, "Job listing elements not found!"
-        logger.info(f"Found {len(job_items)} job listing elements")
+        logger.info("Found %s job listing elements", len(job_items))
         
-        job_item = job_items[0]
-        logger.info(f"Found {len(job_items)} job listing elements - {job_item}")
-        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", job_item)
-        long_wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+        if seed is not None:
+            sample_index = random.Random(seed).randrange(len(job_items))
+        sample_index = min(sample_index, len(job_items) - 1)
+        logger.info("Sampling job listing %s for the browser click path (seed %s)", sample_index + 1, seed)
+        job_item = job_items[sample_index]
+        self.waits.scrolled_into_view(job_item)
         
         self.actions.move_to_element(job_item).perform()
         logger.info("Hovered over job listing")
         
-        view_buttons = long_wait.until(EC.presence_of_all_elements_located((By.XPATH, "//a[contains(text(),'View Role')]")))
-        
-        if len(view_buttons) == 0:
-            view_buttons = long_wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".position-list-item-wrapper a.btn")))
-        
+        view_buttons = LocatorRegistry.find_all(self.driver, "QACareersPage.view_role_buttons", timeout=45)
         assert len(view_buttons) > 0, "'View Role' buttons not found!"
-        logger.info(f"Found {len(view_buttons)} 'View Role' buttons")
+        logger.info("Found %s 'View Role' buttons", len(view_buttons))
         
-        view_button = view_buttons[0]
-        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", view_button)
+        view_button = view_buttons[min(sample_index, len(view_buttons) - 1)]
         self.driver.execute_script("arguments[0].style.display = 'block'; arguments[0].style.visibility = 'visible'; arguments[0].style.opacity = '1';", view_button)
-        long_wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+        self.waits.scrolled_into_view(view_button)
         
         logger.info("Step 8.1: Clicking 'View Role' button")
         self.driver.execute_script("arguments[0].click();", view_button)
@@ -143,23 +332,22 @@ class QACareersPage:
         logger.info("Step 8.2: Waiting for new tab to open")
         long_wait.until(lambda driver: len(driver.window_handles) > 1)
         
-        self.driver.switch_to.window(self.driver.window_handles[-1])
+        BrowserProfiles.switch_to_window(self.driver, self.driver.window_handles[-1])
         
         long_wait.until(lambda driver: driver.current_url != "about:blank")
-        long_wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+        self.waits.dom_settled(timeout=45)
         current_url = self.driver.current_url
-        logger.info(f"Page loaded: {current_url}")
+        logger.info("Page loaded: %s", current_url)
         
-        valid_domains = ["lever.co", "jobs.lever.co"]
-        is_valid_url = any(domain in current_url for domain in valid_domains)
+        is_valid_url = any(domain in current_url for domain in DEFAULT_DOMAINS)
         
         if not is_valid_url:
             page_title = self.driver.title.lower()
-            is_valid_title = any(keyword in page_title for keyword in ["job", "career", "position", "apply", "application", "insider"])
+            is_valid_title = any(keyword in page_title for keyword in DEFAULT_TITLE_KEYWORDS)
             is_valid_url = is_valid_url or is_valid_title
         
         assert is_valid_url, f"View Role button does not redirect correctly! URL: {current_url}"
-        logger.info(f"View Role button verified successfully. URL: {current_url}")
+        logger.info("View Role button verified successfully. URL: %s", current_url)
         
         self.driver.close()
         self.driver.switch_to.window(self.driver.window_handles[0])
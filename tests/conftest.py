@@ -1,29 +1,43 @@
 import sys
 import os
 import pytest
-import datetime
+import json
 import logging
+import operator
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))  
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('test_execution.log'),
-        logging.StreamHandler()
-    ]
-)
+from helpers import parallel
+from helpers.log_pipeline import LogContext, LogPipeline, parse_module_levels
+from helpers import results_stream
+
 logger = logging.getLogger(__name__)
 
+# Timing history is written by the controller process only, opened when the first result arrives
+_timing_database_path = None
+_timing_database = None
+_test_durations = {}
+_test_outcomes = {}
+# Each process appends its own phase results; the controller publishes the summary and report
+_results_stream = None
+
+def _configure_logging(config, log_path):
+    """Sends log records through a background listener to the console and this process's JSON-lines log"""
+    LogPipeline.start(
+        log_path,
+        level=config.getoption("--log-base-level").upper(),
+        module_levels=parse_module_levels(config.getoption("--module-log-level")),
+        worker_id=parallel.worker_id(config),
+    )
+
 def pytest_addoption(parser):
-    """Adds command line option for browser selection"""
+    """Adds command line options for browsers, rendering profiles, driver pooling, session state, network
+    record/replay, duration scheduling, logging, screenshots, results reporting and View Role sampling"""
     parser.addoption(
         "--browser", 
         action="store", 
         default="chrome", 
-        help="Browser to run tests on: chrome or firefox"
+        help="Browser to run tests on: chrome, firefox or a comma-separated matrix such as chrome,firefox"
     )
     parser.addoption(
         "--screenshots-dir",
@@ -31,34 +45,372 @@ def pytest_addoption(parser):
         default=None,
         help="Directory to store screenshots"
     )
+    parser.addoption(
+        "--screenshot-policy",
+        action="store",
+        default="on-failure",
+        choices=("on-failure", "always", "none"),
+        help="When to capture screenshots at teardown"
+    )
+    parser.addoption(
+        "--screenshot-format",
+        action="store",
+        default="jpeg",
+        choices=("jpeg", "webp", "png"),
+        help="Encoding for screenshots (requires Pillow for jpeg/webp)"
+    )
+    parser.addoption(
+        "--profile",
+        action="store",
+        default="default",
+        choices=("default", "fast"),
+        help="Browser rendering profile: default (full fidelity) or fast (headless, no media, eager loading)"
+    )
+    parser.addoption(
+        "--driver-max-uses",
+        action="store",
+        type=int,
+        default=20,
+        help="Number of tests a pooled browser serves before it is recycled"
+    )
+    parser.addoption(
+        "--state-cache",
+        action="store",
+        default=None,
+        help="Session state cache file (default: per-run file in the report directory)"
+    )
+    parser.addoption(
+        "--state-ttl",
+        action="store",
+        type=int,
+        default=1800,
+        help="Seconds before cached consent/session state expires"
+    )
+    parser.addoption(
+        "--invalidate-state",
+        action="store_true",
+        default=False,
+        help="Discard cached session state before the run"
+    )
+    parser.addoption(
+        "--record",
+        action="store",
+        default=None,
+        metavar="ARCHIVE_DIR",
+        help="Record pages, XHR and job data into a traffic archive (Chrome only)"
+    )
+    parser.addoption(
+        "--replay",
+        action="store",
+        default=None,
+        metavar="ARCHIVE_DIR",
+        help="Serve the site from a recorded traffic archive on a local HTTP server"
+    )
+    parser.addoption(
+        "--replay-latency-ms",
+        action="store",
+        type=int,
+        default=0,
+        help="Artificial latency added to every replayed response"
+    )
+    parser.addoption(
+        "--timings-db",
+        action="store",
+        default=".pytest_timings.sqlite",
+        help="SQLite database of historical test durations used for scheduling"
+    )
+    parser.addoption(
+        "--schedule",
+        action="store",
+        default="duration",
+        choices=("duration", "none"),
+        help="duration: start the slowest tests first and bin-pack them across workers with --dist loadgroup"
+    )
+    parser.addoption(
+        "--offline-drivers",
+        action="store_true",
+        default=False,
+        help="Resolve browser drivers from the local cache only, without network lookups"
+    )
+    parser.addoption(
+        "--log-base-level",
+        action="store",
+        default="INFO",
+        help="Root log level for the JSON-lines execution log and console"
+    )
+    parser.addoption(
+        "--module-log-level",
+        action="append",
+        default=[],
+        help="Per-module log level as <logger>=<LEVEL>, e.g. helpers.wait_engine=DEBUG; may be repeated"
+    )
+    parser.addoption(
+        "--results-summary",
+        action="store",
+        default=None,
+        help="Also copy the run's summary.json to this fixed path, e.g. for CI status checks"
+    )
+    parser.addoption(
+        "--view-role-seed",
+        action="store",
+        type=int,
+        default=None,
+        help="Sample the job listing whose 'View Role' click path is checked with this seed instead of using the first"
+    )
+
+@pytest.fixture(scope="session")
+def artifact_writer(request):
+    """Provides the background screenshot writer, flushed at the end of the session"""
+    from helpers.artifact_writer import ArtifactWriter
+
+    writer = ArtifactWriter(pytest.screenshots_dir, image_format=request.config.getoption("--screenshot-format"))
+    yield writer
+    writer.close()
+
+@pytest.fixture(scope="session")
+def session_state(request):
+    """Provides the cache of cookies and storage captured after the first consent flow"""
+    from helpers.session_state import SessionStateCache
+
+    path = request.config.getoption("--state-cache") or os.path.join(pytest.session_dir, 'session_state.json')
+    cache = SessionStateCache(path, ttl=request.config.getoption("--state-ttl"))
+    if request.config.getoption("--invalidate-state"):
+        cache.invalidate()
+    return cache
+
+def pytest_generate_tests(metafunc):
+    """Runs browser-dependent tests once per browser in the --browser matrix"""
+    if "browser" in metafunc.fixturenames:
+        browsers = [name.strip() for name in metafunc.config.getoption("--browser").split(",") if name.strip()]
+        metafunc.parametrize("browser", browsers, scope="session")
+
+@pytest.fixture(scope="session")
+def driver_pool(request, session_state, browser):
+    """Provides a session-wide pool of warm WebDriver instances for one browser of the matrix"""
+    from helpers.driver_manager import DriverPool
+
+    if request.config.getoption("--record"):
+        network_mode = "record"
+    elif request.config.getoption("--replay"):
+        network_mode = "replay"
+    else:
+        network_mode = "live"
+    pool = DriverPool(
+        browser,
+        profile=request.config.getoption("--profile"),
+        max_uses=request.config.getoption("--driver-max-uses"),
+        state_cache=session_state,
+        network_mode=network_mode
+    )
+
+    yield pool
+
+    pool.close_all()
+    logger.info("WebDriver pool statistics: %s", pool.report())
+
+@pytest.fixture(scope="session")
+def replay_server(request):
+    """Serves the recorded site locally when --replay is given"""
+    archive_dir = request.config.getoption("--replay")
+    if not archive_dir:
+        yield None
+        return
+
+    from helpers.replay_server import ReplayServer, TrafficArchive
+
+    server = ReplayServer(TrafficArchive(archive_dir), latency_ms=request.config.getoption("--replay-latency-ms"))
+    server.start()
+    yield server
+    server.stop()
+
+@pytest.fixture(scope="session")
+def traffic_recorder(request):
+    """Provides a recorder that archives site traffic when --record is given"""
+    archive_dir = request.config.getoption("--record")
+    if not archive_dir:
+        return None
+
+    from helpers.replay_server import TrafficArchive, TrafficRecorder
+    return TrafficRecorder(TrafficArchive(archive_dir))
+
+@pytest.fixture(scope="session")
+def site_url(replay_server):
+    """Maps live site URLs onto the replay server when replaying"""
+    return replay_server.url_for if replay_server else (lambda url: url)
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Configures HTML report generation"""
+    """Streams each finished test phase to this process's results file"""
     outcome = yield
     report = outcome.get_result()
-    report.extra = getattr(report, "extra", [])
     setattr(item, f"rep_{report.when}", report)
     
-    if report.when == "call" and report.failed:
-        # Screenshot capture is handled in test_insider_careers.py
-        pass
+    step_recorder = getattr(item, "step_recorder", None)
+    steps = step_recorder.summary_rows() if report.when == "call" and step_recorder else ()
+    artifacts = getattr(item, "artifacts", [])
+    item.artifacts = []
+    if _results_stream is not None:
+        _results_stream.write(report, artifacts, steps)
 
 @pytest.hookimpl(tryfirst=True)
 def pytest_configure(config):
-    """Creates a unique report directory for each test run"""
-    timestamp = datetime.datetime.now().strftime('%Y%m%d-%H%M%S')
-    
-    session_dir = os.path.join('reports', f'test_run_{timestamp}')
-    if not os.path.exists(session_dir):
-        os.makedirs(session_dir)
+    """Creates a unique report directory for each test run and an isolated subdirectory for each worker"""
+    if parallel.is_worker(config):
+        session_dir = config.workerinput["session_dir"]
+    else:
+        session_dir = parallel.new_session_dir()
+    pytest.session_dir = session_dir
     
-    config.option.htmlpath = os.path.join(session_dir, 'report.html')
+    worker_id = parallel.worker_id(config)
+    # Directories are created on first write, so collection-only runs leave nothing behind
+    pytest.worker_dir = os.path.join(session_dir, worker_id)
+    _configure_logging(config, os.path.join(pytest.worker_dir, parallel.LOG_FILE_NAME))
+    global _results_stream
+    _results_stream = results_stream.ResultsStream(
+        os.path.join(pytest.worker_dir, results_stream.RESULTS_FILE_NAME), worker_id
+    )
     
     # Set screenshots directory
     screenshots_dir = config.getoption("--screenshots-dir") or os.environ.get("SCREENSHOT_DIR", "screenshots")
-    pytest.screenshots_dir = screenshots_dir
-    
-    # Ensure screenshots directory exists
-    if not os.path.exists(screenshots_dir):
-        os.makedirs(screenshots_dir)
+    pytest.screenshots_root = screenshots_dir
+    pytest.screenshots_dir = parallel.worker_screenshots_dir(screenshots_dir, worker_id)
+
+    if config.getoption("--offline-drivers"):
+        from helpers.driver_resolver import DriverResolver
+        DriverResolver.offline = True
+
+    if not parallel.is_worker(config):
+        global _timing_database_path
+        _timing_database_path = config.getoption("--timings-db")
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(session, config, items):
+    """Orders tests slowest-first from recorded history and bin-packs them into xdist groups
+
+    Runs first so the xdist_group markers exist before xdist's own hook reads them into the node ids.
+    """
+    if config.getoption("--schedule") != "duration" or not os.path.exists(config.getoption("--timings-db")):
+        return
+
+    from helpers.timing_db import TimingDatabase, longest_first_grouped, pack_bins
+
+    database = TimingDatabase(config.getoption("--timings-db"))
+    durations = database.expected_durations()
+    database.close()
+    if not durations:
+        return
+
+    keyed = [(_timing_key(item.nodeid), item) for item in items]
+    by_browser = operator.itemgetter(1)
+    worker_count = config.workerinput["workercount"] if parallel.is_worker(config) else 1
+    # Workers see dist="no"; the loadgroup flag is the reliable signal there
+    if worker_count > 1 and config.getvalue("loadgroup"):
+        keys = {id(item): key for key, item in keyed}
+        ordered = []
+        for index, group in enumerate(pack_bins(keyed, durations, worker_count)):
+            for item in group:
+                item.add_marker(pytest.mark.xdist_group(name=f"bin{index}"))
+            ordered.extend(longest_first_grouped([(keys[id(item)], item) for item in group], durations, by_browser))
+        items[:] = [item for _, item in ordered]
+    else:
+        items[:] = [item for _, item in longest_first_grouped(keyed, durations, by_browser)]
+    # Collection runs before any test is selected; logging at INFO here would create the run directory
+    logger.debug("Scheduled %s tests slowest-first using %s recorded durations", len(items), len(durations))
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Tags log records emitted while a test runs with its node id"""
+    LogContext.test_id = item.nodeid
+    yield
+    LogContext.test_id = None
+
+def pytest_runtest_logreport(report):
+    """Accumulates each test's setup, call and teardown time and stores the total in the timing database"""
+    timing_database = _open_timing_database()
+    if timing_database is None:
+        return
+    _test_durations[report.nodeid] = _test_durations.get(report.nodeid, 0.0) + report.duration
+    if report.failed:
+        _test_outcomes[report.nodeid] = "failed"
+    if report.when == "teardown":
+        nodeid, browser = _timing_key(report.nodeid)
+        timing_database.record(
+            nodeid, browser, _test_durations.pop(report.nodeid), _test_outcomes.pop(report.nodeid, "passed")
+        )
+
+def _open_timing_database():
+    """Returns the controller's timing database, opening it on first use"""
+    global _timing_database
+    if _timing_database is None and _timing_database_path is not None:
+        from helpers.timing_db import TimingDatabase
+        _timing_database = TimingDatabase(_timing_database_path)
+    return _timing_database
+
+def _timing_key(nodeid):
+    """Returns the (nodeid, browser) key timing history is stored under, without any xdist group suffix"""
+    nodeid = parallel.strip_group_suffix(nodeid)
+    return nodeid, _browser_from_nodeid(nodeid)
+
+def _browser_from_nodeid(nodeid):
+    """Extracts the matrix browser from a parametrized node id such as test_x[chrome]"""
+    if nodeid.endswith("]"):
+        for param in nodeid[nodeid.rindex("[") + 1:-1].split("-"):
+            if param in ("chrome", "firefox"):
+                return param
+    return "default"
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Shares the controller's run directory with each pytest-xdist worker"""
+    node.workerinput["session_dir"] = pytest.session_dir
+
+def pytest_sessionfinish(session, exitstatus):
+    """Writes the locator fallback report and, on the controller, merges worker logs and artifacts"""
+    _write_locator_report()
+    _results_stream.close()
+    if parallel.is_worker(session.config):
+        return
+    if _timing_database is not None:
+        _timing_database.close()
+    if session.config.option.collectonly:
+        return
+    _publish_results(session.config)
+    LogPipeline.flush()
+    parallel.merge_session(pytest.session_dir, pytest.screenshots_root)
+
+def pytest_unconfigure(config):
+    """Flushes the queued log records before the process exits"""
+    LogPipeline.stop()
+
+def _publish_results(config):
+    """Builds summary.json and the HTML report from every worker's results stream"""
+    workers = sorted(os.listdir(pytest.session_dir)) if os.path.isdir(pytest.session_dir) else []
+    result_paths = [
+        os.path.join(pytest.session_dir, worker, results_stream.RESULTS_FILE_NAME) for worker in workers
+    ]
+    summary = results_stream.publish(pytest.session_dir, result_paths)
+    summary_copy = config.getoption("--results-summary")
+    if summary_copy:
+        os.makedirs(os.path.dirname(os.path.abspath(summary_copy)), exist_ok=True)
+        results_stream.write_summary(summary_copy, summary)
+
+def _write_locator_report():
+    """Writes the locator fallback report and flags elements whose primary locator went stale"""
+    # Nothing can have been registered unless a page object was imported, so avoid importing Selenium here
+    locator_registry = sys.modules.get("helpers.locator_registry")
+    if locator_registry is None:
+        return
+
+    report = locator_registry.LocatorRegistry.report()
+    if not any(entry["matches"] for entry in report.values()):
+        return
+
+    os.makedirs(pytest.worker_dir, exist_ok=True)
+    report_path = os.path.join(pytest.worker_dir, 'locator_report.json')
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    logger.info("Locator report written to: %s", report_path)
+
+    for name, entry in report.items():
+        if entry["stale_primary"]:
+            logger.warning("Primary locator for '%s' is stale: %s (matches: %s)", name, entry['primary'], entry['matches'])
@@ -0,0 +1,29 @@
+import os
+import zlib
+import struct
+from helpers.artifact_writer import ArtifactWriter
+
+
+def _png(width, height, shade):
+    """Builds a minimal solid-colour RGB PNG"""
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    rows = b"".join(b"\x00" + bytes([shade, shade, shade]) * width for _ in range(height))
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(rows)) + chunk(b"IEND", b"")
+
+
+def test_writes_in_background_and_skips_duplicates(tmp_path):
+    writer = ArtifactWriter(str(tmp_path), image_format="png")
+
+    first = writer.submit(_png(4, 4, 0), "test_one")
+    duplicate = writer.submit(_png(4, 4, 0), "test_two")
+    second = writer.submit(_png(4, 4, 255), "test_three")
+    writer.close()
+
+    assert duplicate == first
+    assert second != first
+    assert sorted(os.listdir(tmp_path)) == sorted([os.path.basename(first), os.path.basename(second)])
+    assert writer.stats["written"] == 2
+    assert writer.stats["duplicates"] == 1
@@ -0,0 +1,47 @@
+import urllib.request
+import pytest
+from helpers import benchmark
+
+
+def _run(wall, filter_seconds, commands=40):
+    return {"wall": wall, "commands": commands, "steps": {
+        "HomePage.open_page": {"duration": 0.4, "commands": 8},
+        "QACareersPage.filter_jobs": {"duration": filter_seconds, "commands": 5},
+    }}
+
+
+def test_percentiles_interpolate():
+    assert benchmark.percentile([1, 2, 3, 4], 50) == 2.5
+    assert benchmark.percentile([5], 95) == 5
+    assert benchmark.percentile([1, 2, 3, 4, 5], 90) == pytest.approx(4.6)
+
+
+def test_flags_steps_that_regress_beyond_the_threshold():
+    baseline = benchmark.summarize_runs([_run(3.0, 1.0), _run(3.2, 1.1), _run(3.1, 0.9)])
+    current = benchmark.summarize_runs([_run(3.5, 1.5), _run(3.6, 1.4), _run(3.4, 1.6)])
+
+    regressions = benchmark.find_regressions(current, baseline, threshold=0.2)
+
+    assert [(r["step"], r["kind"]) for r in regressions] == [("QACareersPage.filter_jobs", "duration")]
+    assert benchmark.find_regressions(baseline, baseline) == []
+
+
+def test_flags_extra_webdriver_round_trips():
+    baseline = benchmark.summarize_runs([_run(3.0, 1.0, commands=40)])
+    current = benchmark.summarize_runs([_run(3.0, 1.0, commands=60)])
+
+    assert [(r["step"], r["kind"]) for r in benchmark.find_regressions(current, baseline)] == [("(total)", "commands")]
+
+
+def test_fixture_site_serves_the_real_locators():
+    server = benchmark.FixtureServer().start()
+    try:
+        pages = {path: urllib.request.urlopen(server.url(path)).read().decode()
+                 for path in ("/", "/careers/", "/careers/open-positions/", "/jobs/?id=1")}
+    finally:
+        server.stop()
+
+    assert 'id="wt-cli-accept-all-btn"' in pages["/"] and "ins-close-button" in pages["/"]
+    assert 'data-id="a8e7b90"' in pages["/careers/"] and "Find your dream job" in pages["/careers/"]
+    assert 'id="select2-filter-by-location-container"' in pages["/careers/open-positions/"]
+    assert "<title>Insider - Job Application</title>" in pages["/jobs/?id=1"]
@@ -0,0 +1,44 @@
+from helpers.browser_profiles import BLOCKED_URL_PATTERNS, FAST, BrowserProfiles
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class FakeCdpDriver:
+    """Records CDP calls and scripts together with the window they were sent to"""
+
+    def __init__(self):
+        self.current_window_handle = "tab-1"
+        self.switch_to = FakeSwitchTo(self)
+        self.cdp_calls = []
+        self.scripts = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_calls.append((self.current_window_handle, command))
+        return {"identifier": str(len(self.cdp_calls))}
+
+    def execute_script(self, script):
+        self.scripts.append(self.current_window_handle)
+
+
+def test_fast_profile_follows_the_driver_into_new_tabs():
+    driver = FakeCdpDriver()
+    BrowserProfiles.on_driver_started(driver, FAST)
+
+    BrowserProfiles.switch_to_window(driver, "tab-2")
+    BrowserProfiles.switch_to_window(driver, "tab-1")
+    BrowserProfiles.switch_to_window(driver, "tab-2")
+
+    blocked = [handle for handle, command in driver.cdp_calls if command == "Network.setBlockedURLs"]
+    assert blocked == ["tab-1", "tab-2"]
+    assert driver.scripts == ["tab-2"]
+    assert set(driver.no_animation_script_ids) == {"tab-1", "tab-2"}
+
+
+def test_blocked_patterns_cover_query_strings():
+    assert {"*.woff2", "*.woff2?*"} <= set(BLOCKED_URL_PATTERNS)
@@ -0,0 +1,138 @@
+import types
+import pytest
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current = handle
+
+
+class FakeDriver:
+    """Stands in for a WebDriver: tracks open tabs, per-tab origins, CDP calls and whether it was quit"""
+
+    def __init__(self, origins=("https://useinsider.com",)):
+        self.origins = dict(enumerate(origins))
+        self.current = 0
+        self.alive = True
+        self.quit_calls = 0
+        self.cdp_calls = []
+        self.switch_to = FakeSwitchTo(self)
+        self.timeouts = types.SimpleNamespace(script=30)
+        self.script_timeouts = []
+
+    @property
+    def window_handles(self):
+        if not self.alive:
+            raise RuntimeError("browser crashed")
+        return list(self.origins)
+
+    def execute_script(self, script):
+        if "location.origin" in script:
+            return self.origins[self.current]
+        return 1
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_calls.append((command, params))
+        return {}
+
+    def close(self):
+        del self.origins[self.current]
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        self.origins[self.current] = "null"
+
+    def quit(self):
+        self.quit_calls += 1
+
+    def set_script_timeout(self, seconds):
+        self.script_timeouts.append(seconds)
+        self.timeouts.script = seconds
+
+    def execute_async_script(self, script, *args):
+        return {"ok": True}
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    from helpers.driver_manager import DriverManager, DriverPool
+    started = []
+
+    def get_driver(browser, profile, network_mode):
+        started.append(FakeDriver())
+        return started[-1]
+
+    monkeypatch.setattr(DriverManager, "get_driver", staticmethod(get_driver))
+    pool = DriverPool("chrome", max_uses=2, max_size=1)
+    pool.started = started
+    return pool
+
+
+def test_reuses_released_driver(pool):
+    first = pool.acquire()
+    pool.release(first)
+
+    assert pool.acquire() is first
+    report = pool.report()
+    assert (report["hits"], report["misses"], report["startups"]) == (1, 1, 1)
+
+
+def test_recycles_driver_after_max_uses(pool):
+    driver = pool.acquire()
+    pool.release(driver)
+    pool.release(pool.acquire())
+
+    assert driver.quit_calls == 1
+    assert pool.acquire() is not driver
+    assert (pool.stats["recycled"], pool.stats["misses"]) == (1, 2)
+
+
+def test_discards_unhealthy_idle_driver(pool):
+    driver = pool.acquire()
+    pool.release(driver)
+    driver.alive = False
+
+    assert pool.acquire() is not driver
+    assert driver.quit_calls == 1
+    assert pool.stats["unhealthy"] == 1
+
+
+def test_quits_drivers_beyond_max_size(pool):
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+
+    assert (first.quit_calls, second.quit_calls) == (0, 1)
+    pool.close_all()
+    assert first.quit_calls == 1
+
+
+def test_reset_closes_extra_tabs_and_clears_storage_of_every_open_origin():
+    from helpers.driver_manager import DriverPool
+    driver = FakeDriver(origins=("https://useinsider.com", "https://jobs.lever.co"))
+
+    assert DriverPool._reset(driver)
+
+    assert driver.window_handles == [0]
+    cleared = {params["origin"] for command, params in driver.cdp_calls if command == "Storage.clearDataForOrigin"}
+    assert cleared == {"https://useinsider.com", "https://jobs.lever.co"}
+
+
+def test_waits_raise_the_script_timeout_once_and_reset_restores_it():
+    from helpers.driver_manager import DriverPool
+    from helpers.wait_engine import WaitEngine
+    driver = FakeDriver()
+    waits = WaitEngine(driver, timeout=30)
+
+    waits.dom_settled()
+    waits.dom_settled()
+    waits.dom_settled(timeout=3)
+    assert driver.script_timeouts == [35]
+
+    assert DriverPool._reset(driver)
+    assert driver.script_timeouts == [35, 30]
@@ -0,0 +1,57 @@
+import json
+import os
+import stat
+import time
+import pytest
+from helpers.driver_resolver import DriverResolver
+
+
+def _make_executable(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+
+
+@pytest.fixture
+def offline_cache(tmp_path, monkeypatch):
+    """Points the resolver at an isolated offline cache with a fake Chrome install"""
+    browser = tmp_path / "bin" / "google-chrome"
+    _make_executable(str(browser), "#!/bin/sh\necho 'Google Chrome 134.0.6998.165'\n")
+    driver = tmp_path / "cache" / "drivers" / "chromedriver" / "linux64" / "134.0.6998.165" / "chromedriver"
+    _make_executable(str(driver), "")
+    _make_executable(str(tmp_path / "cache" / "drivers" / "chromedriver" / "linux64" / "120.0.6099.109" / "chromedriver"), "")
+
+    monkeypatch.setattr(DriverResolver, "cache_dir", str(tmp_path / "cache"))
+    monkeypatch.setattr(DriverResolver, "offline", True)
+    monkeypatch.setattr(DriverResolver, "_resolved", {})
+    return str(browser), str(driver)
+
+
+def test_resolves_matching_driver_offline_and_persists_index(offline_cache):
+    browser, driver = offline_cache
+
+    assert DriverResolver.resolve("chrome", browser) == driver
+
+    with open(os.path.join(DriverResolver.cache_dir, "driver_index.json")) as f:
+        index = json.load(f)
+    assert index["drivers"]["chrome:134"] == driver
+    assert index["browsers"][browser]["version"] == "134.0.6998.165"
+
+
+def test_warm_lookup_is_sub_millisecond(offline_cache):
+    browser, driver = offline_cache
+    DriverResolver.resolve("chrome", browser)
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        DriverResolver.resolve("chrome", browser)
+    assert (time.perf_counter() - start) / 1000 < 0.001
+
+
+def test_offline_miss_raises(offline_cache, tmp_path):
+    browser = tmp_path / "bin" / "chromium"
+    _make_executable(str(browser), "#!/bin/sh\necho 'Chromium 99.0.4844.51'\n")
+
+    with pytest.raises(RuntimeError, match="offline mode"):
+        DriverResolver.resolve("chrome", str(browser))
@@ -0,0 +1,34 @@
+from helpers.job_listing_validator import JobListing, JobListingValidator
+
+
+def _listings(count, bad_every=None):
+    for index in range(count):
+        department = "Sales" if bad_every and index % bad_every == 0 else "Quality Assurance"
+        yield JobListing(f"QA Engineer {index}", department, "Istanbul, Turkiye", f"https://jobs.lever.co/useinsider/{index}")
+
+
+def test_reports_all_mismatches_but_keeps_only_a_sample():
+    validator = JobListingValidator(department="Quality Assurance", location="Istanbul, Turkiye",
+                                    link_domains=("lever.co",), max_reported=3)
+
+    report = validator.validate(_listings(10000, bad_every=100))
+
+    assert report["checked"] == 10000
+    assert report["mismatched"] == 100
+    assert len(report["mismatches"]) == 3
+    assert report["mismatches"][0]["reasons"] == ["department 'Sales' != 'Quality Assurance'"]
+
+
+def test_flags_missing_links_and_foreign_domains():
+    validator = JobListingValidator(link_domains=("lever.co",))
+    listings = [
+        JobListing("A", "QA", "Istanbul", None),
+        JobListing("B", "QA", "Istanbul", "https://example.com/jobs/1"),
+    ]
+
+    report = validator.validate(iter(listings))
+
+    assert [mismatch["reasons"][0] for mismatch in report["mismatches"]] == [
+        "missing link",
+        "link 'https://example.com/jobs/1' outside ['lever.co']",
+    ]
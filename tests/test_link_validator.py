@@ -0,0 +1,60 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from helpers.link_validator import LinkValidator
+
+
+class StubJobBoard(BaseHTTPRequestHandler):
+    """Serves job pages, a redirect and a missing page, each after a short delay"""
+
+    def do_GET(self):
+        time.sleep(0.2)
+        if self.path == "/apply":
+            self.send_response(302)
+            self.send_header("Location", "/jobs/1")
+            self.end_headers()
+        elif self.path.startswith("/jobs/"):
+            body = b"<html><head><title>Insider - QA Engineer</title></head><body>Apply</body></html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self.send_error(404)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def job_board():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubJobBoard)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_validates_links_concurrently(job_board):
+    validator = LinkValidator(allowed_domains=("jobs.lever.co",), max_workers=8)
+    urls = [f"{job_board}/jobs/{index}" for index in range(8)]
+
+    start = time.perf_counter()
+    results = validator.validate(urls)
+    elapsed = time.perf_counter() - start
+    validator.close()
+
+    assert all(result["ok"] and result["title_ok"] for result in results)
+    assert elapsed < 1.0, f"8 links at 0.2s each took {elapsed:.2f}s"
+
+
+def test_follows_redirects_and_reports_failures(job_board):
+    validator = LinkValidator(allowed_domains=("127.0.0.1",), title_keywords=())
+    redirected, missing = validator.validate([f"{job_board}/apply", f"{job_board}/gone"])
+    validator.close()
+
+    assert redirected["ok"] and redirected["final_url"] == f"{job_board}/jobs/1"
+    assert redirected["domain_ok"]
+    assert not missing["ok"] and missing["status"] == 404
@@ -0,0 +1,100 @@
+import json
+import logging
+import os
+import queue
+import pytest
+from helpers import parallel
+from helpers.log_pipeline import ContextFilter, LazyQueueHandler, LogContext, LogPipeline, parse_module_levels
+
+
+class ExpensiveRepr:
+    """Stands in for objects such as WebElements whose repr should not be built on the caller's thread"""
+
+    renders = 0
+
+    def __repr__(self):
+        ExpensiveRepr.renders += 1
+        return "<expensive>"
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    # Set the session's own pipeline aside rather than stopping it
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    saved_pipeline = LogPipeline._listener, LogPipeline._handler, LogContext.worker_id
+    LogPipeline._listener = LogPipeline._handler = None
+    log_path = tmp_path / "main" / parallel.LOG_FILE_NAME
+    log_path.parent.mkdir()
+    LogPipeline.start(str(log_path), module_levels={"pipeline.quiet": "WARNING"}, console=False, worker_id="gw3")
+    yield log_path
+    LogPipeline.stop()
+    root.handlers[:], root.level = saved_handlers, saved_level
+    LogPipeline._listener, LogPipeline._handler, LogContext.worker_id = saved_pipeline
+    logging.getLogger("pipeline.quiet").setLevel(logging.NOTSET)
+
+
+def _records(log_path):
+    with open(log_path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_queue_handler_defers_formatting():
+    log_queue = queue.SimpleQueue()
+    handler = LazyQueueHandler(log_queue)
+    handler.addFilter(ContextFilter())
+    ExpensiveRepr.renders = 0
+
+    handler.handle(logging.LogRecord("pages", logging.INFO, __file__, 1, "element %r clicked", (ExpensiveRepr(),), None))
+
+    queued = log_queue.get_nowait()
+    assert ExpensiveRepr.renders == 0
+    assert queued.getMessage() == "element <expensive> clicked"
+
+
+def test_records_are_tagged_with_test_and_worker(pipeline):
+    LogContext.test_id = "tests/test_x.py::test_y"
+
+    logging.getLogger("pipeline.loud").info("element %r clicked", ExpensiveRepr())
+    logging.getLogger("pipeline.quiet").info("suppressed by the module level")
+    LogPipeline.flush()
+
+    (record,) = _records(pipeline)
+    assert record["message"] == "element <expensive> clicked"
+    assert (record["worker"], record["test"], record["logger"]) == ("gw3", "tests/test_x.py::test_y", "pipeline.loud")
+
+
+def test_merge_orders_worker_records_by_timestamp(tmp_path):
+    for worker, stamps in (("gw0", [1.0, 3.0]), ("gw1", [2.0, 4.0])):
+        os.makedirs(tmp_path / worker)
+        with open(tmp_path / worker / parallel.LOG_FILE_NAME, "w") as f:
+            for ts in stamps:
+                f.write(json.dumps({"ts": ts, "worker": worker}) + "\n")
+
+    merged = parallel.merge_worker_logs(str(tmp_path))
+
+    assert [record["ts"] for record in _records(merged)] == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_artifact_index_finds_screenshots_with_and_without_xdist(tmp_path):
+    session_dir, screenshots_root = tmp_path / "run", tmp_path / "screenshots"
+    for worker in ("main", "gw0"):
+        os.makedirs(session_dir / worker)
+        shots = parallel.worker_screenshots_dir(str(screenshots_root), worker)
+        os.makedirs(shots, exist_ok=True)
+        open(os.path.join(shots, f"{worker}.png"), "w").close()
+
+    with open(parallel.write_artifact_index(str(session_dir), str(screenshots_root))) as f:
+        index = json.load(f)
+
+    assert index["main"]["screenshots"] == [str(screenshots_root / "main.png")]
+    assert index["gw0"]["screenshots"] == [str(screenshots_root / "gw0" / "gw0.png")]
+
+
+def test_parses_module_levels():
+    assert parse_module_levels(["helpers.wait_engine=debug,pages=WARNING"]) == {
+        "helpers.wait_engine": "DEBUG",
+        "pages": "WARNING",
+    }
+    with pytest.raises(ValueError):
+        parse_module_levels(["helpers.wait_engine"])
@@ -0,0 +1,94 @@
+import json
+import time
+import urllib.error
+import urllib.request
+import pytest
+from helpers.replay_server import ReplayServer, TrafficArchive, TrafficRecorder
+
+
+@pytest.fixture
+def replay(tmp_path):
+    """Starts a replay server over a small recorded archive"""
+    archive = TrafficArchive(str(tmp_path / "archive"))
+    archive.add("GET", "https://useinsider.com/careers/", 200, "text/html",
+                b'<a href="https://useinsider.com/careers/quality-assurance/">QA</a>'
+                b'<script src="https://api.lever.co/v0/postings/useinsider"></script>')
+    archive.add("GET", "https://useinsider.com/wp-content/app.js", 200, "application/javascript", b"var ok = 1;")
+    archive.add("GET", "https://api.lever.co/v0/postings/useinsider", 200, "application/json", b"[]")
+    archive.save()
+
+    server = ReplayServer(TrafficArchive(str(tmp_path / "archive")), latency_ms=50).start()
+    yield server
+    server.stop()
+
+
+def test_serves_recorded_pages_with_rewritten_urls(replay):
+    start = time.perf_counter()
+    with urllib.request.urlopen(replay.url_for("https://useinsider.com/careers/")) as response:
+        body = response.read().decode()
+
+    assert time.perf_counter() - start >= 0.05
+    assert f'href="{replay.origin}/useinsider.com/careers/quality-assurance/"' in body
+    assert f'src="{replay.origin}/api.lever.co/v0/postings/useinsider"' in body
+
+
+def test_resolves_root_relative_paths_through_referer(replay):
+    request = urllib.request.Request(
+        f"{replay.origin}/wp-content/app.js",
+        headers={"Referer": replay.url_for("https://useinsider.com/careers/")},
+    )
+    with urllib.request.urlopen(request) as response:
+        assert response.read() == b"var ok = 1;"
+
+
+def test_unrecorded_urls_return_404(replay):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        urllib.request.urlopen(replay.url_for("https://useinsider.com/missing/"))
+    assert error.value.code == 404
+    assert replay.stats["misses"] == 1
+
+
+class FakeRecordingDriver:
+    """Returns queued performance-log batches and serves bodies only for requests whose loading finished"""
+
+    def __init__(self):
+        self.batches = []
+        self.finished = set()
+        self.body_requests = []
+
+    def log(self, *events):
+        self.batches.append([{"message": json.dumps({"message": {"method": method, "params": params}})}
+                             for method, params in events])
+        self.finished.update(params["requestId"] for method, params in events if method == "Network.loadingFinished")
+
+    def get_log(self, log_type):
+        return self.batches.pop(0) if self.batches else []
+
+    def execute_cdp_cmd(self, command, params):
+        if command == "Network.getResponseBody":
+            self.body_requests.append(params["requestId"])
+            if params["requestId"] not in self.finished:
+                raise RuntimeError("No data found for resource with given identifier")
+            return {"body": "[]", "base64Encoded": False}
+        return {}
+
+    def execute(self, driver_command, params=None):
+        return {}
+
+
+def test_recorder_keeps_in_flight_requests_across_drains(tmp_path):
+    archive = TrafficArchive(str(tmp_path / "archive"))
+    recorder = TrafficRecorder(archive)
+    driver = FakeRecordingDriver()
+    recorder.attach(driver)
+    url = "https://useinsider.com/wp-admin/admin-ajax.php"
+
+    driver.log(("Network.requestWillBeSent", {"requestId": "7", "request": {"method": "POST", "url": url}}))
+    driver.log(("Network.responseReceived", {"requestId": "7", "response": {"url": url, "status": 200, "mimeType": "application/json"}}))
+    driver.log(("Network.loadingFinished", {"requestId": "7"}))
+    for _ in range(3):
+        recorder.drain(driver)
+
+    assert driver.body_requests == ["7"]
+    assert archive.lookup("POST", url) == (200, "application/json", b"[]")
+    assert driver.recording_requests == {}
@@ -0,0 +1,44 @@
+import json
+from types import SimpleNamespace
+from helpers import results_stream
+
+
+def _report(nodeid, when, outcome, longrepr=None):
+    return SimpleNamespace(nodeid=nodeid, when=when, outcome=outcome, duration=0.5, stop=1.0,
+                           failed=outcome == "failed", skipped=outcome == "skipped", longrepr=longrepr)
+
+
+def test_streams_phases_and_publishes_summary_and_report(tmp_path):
+    worker_dir = tmp_path / "gw0"
+    worker_dir.mkdir()
+    stream = results_stream.ResultsStream(str(worker_dir / results_stream.RESULTS_FILE_NAME), "gw0")
+    for when in ("setup", "call", "teardown"):
+        stream.write(_report("tests/test_a.py::test_ok", when, "passed"),
+                     steps=[("HomePage.open_page", 1.0, 3, 0.5, 0.5)] if when == "call" else ())
+    stream.write(_report("tests/test_a.py::test_broken", "setup", "passed"))
+    stream.write(_report("tests/test_a.py::test_broken", "call", "failed", "AssertionError: <no jobs>"))
+    stream.write(_report("tests/test_a.py::test_broken", "teardown", "passed"), artifacts=["screenshots/broken.png"])
+    stream.close()
+
+    summary = results_stream.publish(str(tmp_path), [str(worker_dir / results_stream.RESULTS_FILE_NAME)])
+
+    assert summary["status"] == "failed"
+    assert (summary["total"], summary["passed"], summary["failed"]) == (2, 1, 1)
+    with open(tmp_path / results_stream.SUMMARY_FILE_NAME) as f:
+        assert json.load(f) == summary
+    with open(tmp_path / results_stream.REPORT_FILE_NAME) as f:
+        report = f.read()
+    assert "AssertionError: &lt;no jobs&gt;" in report
+    assert "broken.png</a>" in report
+    assert "HomePage.open_page" in report
+
+
+def test_setup_failures_count_as_errors_and_empty_runs_fail():
+    records = [
+        {"nodeid": "t::x", "when": "setup", "outcome": "failed", "duration": 0.1},
+        {"nodeid": "t::y", "when": "setup", "outcome": "skipped", "duration": 0.0},
+    ]
+
+    assert results_stream.summarize(iter(records))["error"] == 1
+    assert results_stream.summarize(iter(records))["skipped"] == 1
+    assert results_stream.summarize(iter([]))["status"] == "failed"
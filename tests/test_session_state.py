@@ -0,0 +1,44 @@
+import time
+from helpers.session_state import SessionStateCache
+
+
+class FakeCdpDriver:
+    """Records CDP calls and hands out init-script identifiers like Chrome does"""
+
+    def __init__(self):
+        self.calls = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.calls.append((command, params))
+        if command == "Network.getAllCookies":
+            return {"cookies": [{"name": "consent", "value": "yes", "domain": ".example.com", "expires": -1}]}
+        if command == "Page.addScriptToEvaluateOnNewDocument":
+            return {"identifier": str(len(self.calls))}
+        return {}
+
+    def execute_script(self, script):
+        return {"origin": "https://example.com", "local": {"seen": "1"}, "session": {}}
+
+
+def _commands(driver, name):
+    return [params for command, params in driver.calls if command == name]
+
+
+def test_refreshed_cache_replaces_the_seed_script_on_pooled_drivers(tmp_path):
+    cache = SessionStateCache(str(tmp_path / "state.json"))
+    driver = FakeCdpDriver()
+    cache.save(driver)
+
+    assert cache.apply(driver) and cache.apply(driver)
+    assert len(_commands(driver, "Page.addScriptToEvaluateOnNewDocument")) == 1
+
+    time.sleep(0.01)
+    cache.save(driver)
+    assert cache.apply(driver)
+    first_identifier = _commands(driver, "Page.removeScriptToEvaluateOnNewDocument")[0]["identifier"]
+    assert len(_commands(driver, "Page.addScriptToEvaluateOnNewDocument")) == 2
+    assert driver.session_state_script["identifier"] != first_identifier
+
+    cache.invalidate()
+    assert not cache.apply(driver)
+    assert driver.session_state_script is None
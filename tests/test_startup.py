@@ -0,0 +1,22 @@
+import os
+from helpers.startup_profile import ROOT_DIR, profile_collection
+from helpers.timing_db import TimingDatabase
+
+
+def test_collection_does_not_import_the_browser_stack():
+    profile = profile_collection(["tests"])
+
+    assert profile["returncode"] == 0
+    assert profile["heavy"] == [], f"Collection imported browser-only modules: {profile['heavy']}"
+
+
+def test_collection_leaves_nothing_on_disk(tmp_path):
+    # Timing history makes collection reorder tests, which must not open the run directory either
+    database = TimingDatabase(str(tmp_path / ".pytest_timings.sqlite"))
+    database.record("tests/test_timing_db.py::test_pack_bins_balances_load", "default", 0.1, "passed")
+    database.close()
+
+    profile = profile_collection([os.path.join(ROOT_DIR, "tests")], cwd=str(tmp_path))
+
+    assert profile["returncode"] == 0
+    assert sorted(os.listdir(tmp_path)) == [".pytest_timings.sqlite"]
@@ -0,0 +1,118 @@
+import os
+import subprocess
+import sys
+from helpers import parallel
+from helpers.timing_db import TimingDatabase, longest_first, longest_first_grouped, pack_bins
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_expected_durations_average_recent_history(tmp_path):
+    database = TimingDatabase(str(tmp_path / "timings.sqlite"), history=2)
+    for recorded_at, duration in enumerate((100.0, 10.0, 20.0)):
+        database.record("tests/test_a.py::test_a[chrome]", "chrome", duration, "passed", recorded_at=recorded_at)
+    database.record("tests/test_a.py::test_a[firefox]", "firefox", 5.0, "passed", recorded_at=0)
+
+    durations = database.expected_durations()
+    database.close()
+
+    assert durations[("tests/test_a.py::test_a[chrome]", "chrome")] == 15.0
+    assert durations[("tests/test_a.py::test_a[firefox]", "firefox")] == 5.0
+
+
+def test_longest_first_places_unknown_tests_at_the_mean():
+    durations = {"slow": 30.0, "fast": 10.0}
+    tests = [("fast", "fast"), ("new", "new"), ("slow", "slow")]
+
+    assert [test for _, test in longest_first(tests, durations)] == ["slow", "new", "fast"]
+
+
+def test_pack_bins_balances_load():
+    durations = {name: duration for name, duration in zip("abcdef", (8, 7, 6, 5, 4, 3))}
+    bins = pack_bins([(name, name) for name in durations], durations, 3)
+
+    loads = sorted(sum(durations[name] for name in group) for group in bins)
+    assert loads == [11, 11, 11]
+
+
+def test_equal_timestamps_fall_back_to_insertion_order(tmp_path):
+    database = TimingDatabase(str(tmp_path / "timings.sqlite"), history=1)
+    for duration in (100.0, 10.0):
+        database.record("t", "chrome", duration, "passed", recorded_at=1.0)
+
+    assert database.expected_durations()[("t", "chrome")] == 10.0
+    database.close()
+
+
+def test_strip_group_suffix_keeps_parameters_containing_at_signs():
+    assert parallel.strip_group_suffix("test_jobs.py::test_job[chrome-fast]@bin0") == "test_jobs.py::test_job[chrome-fast]"
+    assert parallel.strip_group_suffix("test_mail.py::test_send[a@b.com]") == "test_mail.py::test_send[a@b.com]"
+
+
+def test_longest_first_grouped_keeps_browsers_contiguous():
+    durations = {("a", "chrome"): 1.0, ("b", "chrome"): 9.0, ("a", "firefox"): 5.0, ("b", "firefox"): 2.0}
+    tests = [(key, key) for key in durations]
+
+    ordered = [test for _, test in longest_first_grouped(tests, durations, lambda key: key[1])]
+
+    assert ordered == [("b", "chrome"), ("a", "chrome"), ("a", "firefox"), ("b", "firefox")]
+
+
+SCHEDULED_TESTS = """
+import pytest
+
+@pytest.mark.parametrize("name", ["fast", "slow", "medium", "slowest"])
+def test_job(name, browser):
+    pass
+"""
+
+
+def _run_scheduled(tmp_path, *args):
+    """Runs the suite's conftest against a small parametrized module with seeded timing history"""
+    with open(os.path.join(ROOT_DIR, "tests", "conftest.py")) as f:
+        (tmp_path / "conftest.py").write_text(f.read())
+    (tmp_path / "test_jobs.py").write_text(SCHEDULED_TESTS)
+    database = TimingDatabase(str(tmp_path / "timings.sqlite"))
+    for browser in ("chrome", "firefox"):
+        for name, duration in (("fast", 1.0), ("slow", 8.0), ("medium", 4.0), ("slowest", 12.0)):
+            database.record(f"test_jobs.py::test_job[{browser}-{name}]", browser, duration, "passed")
+    database.close()
+
+    env = dict(os.environ, PYTHONPATH=ROOT_DIR)
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", "-v", "-p", "no:cacheprovider", "--timings-db", "timings.sqlite",
+         "--browser", "chrome,firefox", *args],
+        cwd=tmp_path, env=env, capture_output=True, text=True,
+    )
+
+
+def _scheduled_ids(output):
+    return [line.split("::")[1].split()[0] for line in output.splitlines() if "test_jobs.py::" in line and "PASSED" in line]
+
+
+def test_schedule_orders_slowest_first_within_each_browser(tmp_path):
+    result = _run_scheduled(tmp_path)
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert _scheduled_ids(result.stdout) == [
+        f"test_job[{browser}-{name}]" for browser in ("chrome", "firefox") for name in ("slowest", "slow", "medium", "fast")
+    ]
+
+
+def test_schedule_bin_packs_into_xdist_groups(tmp_path):
+    result = _run_scheduled(tmp_path, "-n", "2", "--dist", "loadgroup")
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    ids = _scheduled_ids(result.stdout)
+    assert len(ids) == 8
+    assert all(test_id.endswith(("@bin0", "@bin1")) for test_id in ids), ids
+
+    # The next run must find this run's timings under the same keys the seeded history used
+    database = TimingDatabase(str(tmp_path / "timings.sqlite"), history=1)
+    durations = database.expected_durations()
+    database.close()
+    assert set(durations) == {
+        (f"test_jobs.py::test_job[{browser}-{name}]", browser)
+        for browser in ("chrome", "firefox") for name in ("fast", "slow", "medium", "slowest")
+    }
+    assert all(duration < 1.0 for duration in durations.values()), durations